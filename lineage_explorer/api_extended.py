@@ -9,9 +9,10 @@ This module extends the base server with:
 - Workspace-specific lineage views (/api/workspace/*)
 """
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import json
 import logging
 import os
 
@@ -28,6 +29,9 @@ _stats_calculator: Optional[LineageStatsCalculator] = None
 _neo4j_client = None
 _neo4j_queries = None
 
+# Serialized /api/stats/detailed payload, keyed on the LineageStatistics it was built from
+_detailed_stats_json: Optional[Tuple[LineageStatistics, bytes]] = None
+
 
 def init_stats_calculator(file_path: str):
     """Initialize the stats calculator with a data file."""
@@ -77,12 +81,17 @@ async def get_detailed_stats():
     - External source details
     - MirroredDatabase table statistics
     """
+    global _detailed_stats_json
     if not _stats_calculator:
         raise HTTPException(status_code=503, detail="Stats calculator not initialized")
     
     try:
         stats = _stats_calculator.calculate()
-        return stats.to_dict()
+        # Serialize once per calculation; repeat requests reuse the bytes
+        if _detailed_stats_json is None or _detailed_stats_json[0] is not stats:
+            content = json.dumps(stats.to_dict(), separators=(",", ":"), default=str).encode()
+            _detailed_stats_json = (stats, content)
+        return Response(content=_detailed_stats_json[1], media_type="application/json")
     except Exception as e:
         logger.error(f"Error calculating stats: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Error calculating statistics")
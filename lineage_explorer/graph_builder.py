@@ -7,19 +7,18 @@ Design: Single-pass where possible, minimal string manipulation.
 Supports both JSON (native) and CSV (legacy) input formats.
 """
 
-import pandas as pd
 import hashlib
 import json
 import logging
-from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Set, Union
+import math
 from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
 
-from .models import (
-    LineageGraph, Workspace, FabricItem, ExternalSource, 
-    LineageEdge, GraphStats, Table
-)
+from usf_fabric_monitoring.core.utils import json_loads
+
+from .models import ExternalSource, FabricItem, GraphStats, LineageEdge, LineageGraph, Table, Workspace
 
 logger = logging.getLogger(__name__)
 
@@ -174,9 +173,14 @@ def _extract_tables_from_connection(conn: Dict, source_item_id: Optional[str] =
     return tables
 
 
+def _is_missing(value: Any) -> bool:
+    """True for None and the NaN pandas uses for empty CSV cells."""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
 def _parse_json(value: Any) -> Optional[Dict]:
     """Parse JSON/dict value with fallback."""
-    if pd.isna(value) or value in ('', 'Unknown'):
+    if _is_missing(value) or value in ('', 'Unknown'):
         return None
     if isinstance(value, dict):
         return value
@@ -216,9 +220,12 @@ def _display_name(source_type: str, conn: Dict) -> str:
 
 def build_graph_from_csv(csv_path: Path) -> LineageGraph:
     """Build lineage graph from CSV in two passes."""
+    import pandas as pd  # Only needed for CSV input; keeps the JSON path import-light
+    
     logger.info(f"Loading CSV: {csv_path}")
-    df = pd.read_csv(csv_path)
-    logger.info(f"Processing {len(df)} rows")
+    # Plain dict rows: iterrows() builds a Series per row on each pass
+    rows = pd.read_csv(csv_path).to_dict('records')
+    logger.info(f"Processing {len(rows)} rows")
     
     workspaces: Dict[str, Workspace] = {}
     items: Dict[str, FabricItem] = {}
@@ -228,7 +235,7 @@ def build_graph_from_csv(csv_path: Path) -> LineageGraph:
     known_items: Set[str] = set()
     
     # Pass 1: Collect workspaces and items
-    for _, row in df.iterrows():
+    for row in rows:
         ws_id, item_id = str(row.get('Workspace ID', '')), str(row.get('Item ID', ''))
         
         if ws_id and ws_id != 'nan' and ws_id not in workspaces:
@@ -243,7 +250,7 @@ def build_graph_from_csv(csv_path: Path) -> LineageGraph:
                 )
     
     # Pass 2: Build edges
-    for _, row in df.iterrows():
+    for row in rows:
         target_id = str(row.get('Item ID', ''))
         if not target_id or target_id == 'nan':
             continue
@@ -295,8 +302,9 @@ def build_graph_from_json(json_path: Path) -> LineageGraph:
     """Build lineage graph from JSON file (native format from extract_lineage.py)."""
     logger.info(f"Loading JSON: {json_path}")
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    data = json_loads(raw)
     
     lineage_items = data.get('lineage', [])
     logger.info(f"Processing {len(lineage_items)} items")
@@ -5,7 +5,7 @@ Transforms lineage data into Neo4j graph structure.
 
 Graph Schema:
 - (:Workspace {id, name})
-- (:FabricItem {id, name, type})
+- (:FabricItem {id, name, name_lower, type, in_degree, out_degree, degree})
 - (:ExternalSource {id, type, display_name, ...})
 - (:Table {name, schema, database}) - for granular MirroredDB tables
 - (:Connection {id, type})
@@ -53,7 +53,10 @@ class LineageDataLoader:
     CREATE INDEX workspace_name IF NOT EXISTS FOR (w:Workspace) ON (w.name);
     CREATE INDEX item_name IF NOT EXISTS FOR (i:FabricItem) ON (i.name);
     CREATE INDEX item_type IF NOT EXISTS FOR (i:FabricItem) ON (i.type);
+    CREATE INDEX item_degree IF NOT EXISTS FOR (i:FabricItem) ON (i.degree);
+    CREATE TEXT INDEX item_name_lower IF NOT EXISTS FOR (i:FabricItem) ON (i.name_lower);
     CREATE INDEX source_type IF NOT EXISTS FOR (s:ExternalSource) ON (s.type);
+    CREATE INDEX source_display_name IF NOT EXISTS FOR (s:ExternalSource) ON (s.display_name);
     CREATE INDEX table_name IF NOT EXISTS FOR (t:Table) ON (t.name);
     """
     
@@ -69,10 +72,12 @@ class LineageDataLoader:
     MERGE (i:FabricItem {id: row.item_id})
     ON CREATE SET 
         i.name = row.item_name,
+        i.name_lower = toLower(row.item_name),
         i.type = row.item_type,
         i.workspace_id = row.workspace_id
     ON MATCH SET
         i.name = row.item_name,
+        i.name_lower = toLower(row.item_name),
         i.type = row.item_type
     WITH i, row
     MATCH (w:Workspace {id: row.workspace_id})
@@ -175,6 +180,16 @@ class LineageDataLoader:
     MERGE (report)-[r:READS_FROM]->(dataset)
     """
     
+    # Precomputed degrees so hub/centrality queries sort on a property instead
+    # of expanding every relationship of every item at query time.
+    UPDATE_ITEM_DEGREES = """
+    MATCH (i:FabricItem)
+    WITH i, COUNT { (i)<--() } AS in_degree, COUNT { (i)-->() } AS out_degree
+    SET i.in_degree = in_degree,
+        i.out_degree = out_degree,
+        i.degree = in_degree + out_degree
+    """
+    
     def __init__(self, client: Neo4jClient):
         """
         Initialize data loader.
@@ -201,7 +216,11 @@ class LineageDataLoader:
             "CREATE INDEX workspace_name IF NOT EXISTS FOR (w:Workspace) ON (w.name)",
             "CREATE INDEX item_name IF NOT EXISTS FOR (i:FabricItem) ON (i.name)",
             "CREATE INDEX item_type IF NOT EXISTS FOR (i:FabricItem) ON (i.type)",
+            "CREATE INDEX item_degree IF NOT EXISTS FOR (i:FabricItem) ON (i.degree)",
+            # TEXT index backs the case-insensitive CONTAINS name lookups
+            "CREATE TEXT INDEX item_name_lower IF NOT EXISTS FOR (i:FabricItem) ON (i.name_lower)",
             "CREATE INDEX source_type IF NOT EXISTS FOR (s:ExternalSource) ON (s.type)",
+            "CREATE INDEX source_display_name IF NOT EXISTS FOR (s:ExternalSource) ON (s.display_name)",
             "CREATE INDEX table_name IF NOT EXISTS FOR (t:Table) ON (t.name)",
         ]
         
@@ -213,6 +232,17 @@ class LineageDataLoader:
         
         logger.info("Schema setup complete")
     
+    def refresh_degrees(self) -> Dict[str, Any]:
+        """
+        Recompute the precomputed in/out/total degree of every FabricItem.
+        
+        Runs at the end of every load; call it directly after changing
+        relationships outside this loader, or on a graph loaded before
+        degrees were stored.
+        """
+        logger.info("Updating item degrees...")
+        return self.client.run_write_query(self.UPDATE_ITEM_DEGREES)
+    
     def load_from_json(
         self,
         json_path: Union[str, Path],
@@ -547,6 +577,8 @@ class LineageDataLoader:
             self.client.run_batch_write(self.CREATE_READS_FROM_EDGE, reads_from_edges)
         summary['reads_from_edges'] = len(reads_from_edges)
         
+        self.refresh_degrees()
+        
         summary['load_time_ms'] = int((time.time() - start_time) * 1000)
         logger.info(f"Load complete in {summary['load_time_ms']}ms")
         
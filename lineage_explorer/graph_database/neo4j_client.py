@@ -239,8 +239,9 @@ class Neo4jClient:
         Returns:
             Dict with node and relationship counts
         """
+        # Materialized analytics views are not lineage nodes
         result = self.run_query_single("""
-            MATCH (n)
+            MATCH (n) WHERE NOT n:MaterializedView
             WITH count(n) as nodes
             MATCH ()-[r]->()
             RETURN nodes, count(r) as relationships
@@ -1,9 +1,9 @@
 """Reports package for Lineage Explorer."""
 
 from .chain_depth_report import ChainDepthReporter, ChainDepthReport, generate_chain_depth_report
-from .lineage_analyzer import LineageAnalyzer, DependencyInfo, analyze_with_client
+from .lineage_analyzer import LineageAnalyzer, DependencyInfo, DependencyCounts, analyze_with_client
 
 __all__ = [
     "ChainDepthReporter", "ChainDepthReport", "generate_chain_depth_report",
-    "LineageAnalyzer", "DependencyInfo", "analyze_with_client"
+    "LineageAnalyzer", "DependencyInfo", "DependencyCounts", "analyze_with_client"
 ]
@@ -13,6 +13,22 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Column specs (key, default) for the markdown tables in the report
+DEPTH_DISTRIBUTION_COLUMNS = (("depth", 0), ("count", 0))
+ITEMS_BY_DEPTH_COLUMNS = (
+    ("item_name", "N/A"),
+    ("item_type", "N/A"),
+    ("upstream_depth", 0),
+    ("downstream_depth", 0),
+    ("total_chain_depth", 0),
+)
+
+
+def _table_rows(rows: List[Dict[str, Any]], columns: tuple) -> List[str]:
+    """Format dict rows as markdown table rows using a template built once per table."""
+    template = "| " + " | ".join("{}" for _ in columns) + " |"
+    return [template.format(*[row.get(key, default) for key, default in columns]) for row in rows]
+
 
 @dataclass
 class ChainDepthReport:
@@ -48,8 +64,7 @@ class ChainDepthReport:
                 "| Depth | Count |",
                 "|-------|-------|",
             ])
-            for item in dist:
-                lines.append(f"| {item.get('depth', 0)} | {item.get('count', 0)} |")
+            lines.extend(_table_rows(dist, DEPTH_DISTRIBUTION_COLUMNS))
             lines.append("")
         
         # Deepest chains section
@@ -100,12 +115,7 @@ class ChainDepthReport:
                 "| Item | Type | Upstream | Downstream | Total |",
                 "|------|------|----------|------------|-------|",
             ])
-            for item in self.items_by_depth[:20]:
-                lines.append(
-                    f"| {item.get('item_name', 'N/A')} | {item.get('item_type', 'N/A')} | "
-                    f"{item.get('upstream_depth', 0)} | {item.get('downstream_depth', 0)} | "
-                    f"{item.get('total_chain_depth', 0)} |"
-                )
+            lines.extend(_table_rows(self.items_by_depth[:20], ITEMS_BY_DEPTH_COLUMNS))
             lines.append("")
         
         return "\n".join(lines)
@@ -123,10 +133,13 @@ class ChainDepthReporter:
         """
         self.queries = queries_client
     
-    def generate_report(self) -> ChainDepthReport:
+    def generate_report(self, generated_at: Optional[datetime] = None) -> ChainDepthReport:
         """
         Generate a comprehensive chain depth report.
         
+        Args:
+            generated_at: Report timestamp (default: now)
+            
         Returns:
             ChainDepthReport with all analysis data
         """
@@ -137,7 +150,7 @@ class ChainDepthReporter:
         node_depths = self.queries.get_node_chain_depths()
         
         return ChainDepthReport(
-            generated_at=datetime.now().isoformat(),
+            generated_at=(generated_at or datetime.now()).isoformat(),
             stats=stats,
             deepest_chains=deep_chains,
             items_by_depth=node_depths
@@ -158,12 +171,14 @@ class ChainDepthReporter:
         Returns:
             Path to saved report file
         """
-        report = self.generate_report()
+        # One timestamp for both the report header and the filename
+        now = datetime.now()
+        report = self.generate_report(generated_at=now)
         
         if output_path is None:
             output_dir = Path("exports/reports")
             output_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             output_path = output_dir / f"chain_depth_report_{timestamp}.md"
         else:
             output_path = Path(output_path)
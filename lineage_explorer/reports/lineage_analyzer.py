@@ -10,38 +10,111 @@ allowing you to answer specific questions like:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Set
-from collections import defaultdict
+from typing import Dict, List, Any, Optional, Set, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import inspect
+from itertools import groupby
 import json
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 
+def _ttl_cached(method):
+    """
+    Cache a read-only analyzer method's result on the instance.
+    
+    Results are keyed on method name plus arguments (bound to the signature
+    with defaults applied, so positional, keyword and omitted-default calls
+    share one entry) and expire after the analyzer's cache_ttl_seconds. The cache is an LRU bounded by the
+    analyzer's cache_maxsize, and expired entries are dropped whenever a new
+    one is stored. Cached values are shared between callers, so treat them as
+    read-only.
+    """
+    signature = inspect.signature(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.cache_ttl_seconds <= 0 or self.cache_maxsize <= 0:
+            return method(self, *args, **kwargs)
+        
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__, tuple(bound.arguments.items())[1:])
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < self.cache_ttl_seconds:
+            self._cache.move_to_end(key)
+            return entry[1]
+        
+        result = method(self, *args, **kwargs)
+        self._store_cached(key, now, result)
+        return result
+    return wrapper
+
+
+# Column layout of each DependencyInfo relationship field
+ITEM_COLUMNS = ("id", "name", "type", "workspace")
+TABLE_COLUMNS = ("name", "schema", "database")
+SOURCE_COLUMNS = ("id", "name", "type")
+
+
+def _to_columns(records: List[Dict[str, Any]], columns: tuple) -> Dict[str, List[Any]]:
+    """Transpose a list of row dicts into a dict of parallel column lists."""
+    return {col: [r.get(col) for r in records] for col in columns}
+
+
+def _empty_columns(columns: tuple):
+    return lambda: {col: [] for col in columns}
+
+
 @dataclass
 class DependencyInfo:
-    """Detailed dependency information for an item."""
+    """
+    Detailed dependency information for an item.
+    
+    Relationship fields are stored column-wise: each maps a column name to a
+    list of values, with one position per related node. Iterate rows with
+    e.g. ``zip(info.depends_on["name"], info.depends_on["type"])``.
+    """
     item_id: str
     item_name: str
     item_type: str
     workspace: str
     
-    # Direct relationships
-    depends_on: List[Dict[str, Any]] = field(default_factory=list)  # Items this depends on
-    depended_by: List[Dict[str, Any]] = field(default_factory=list)  # Items that depend on this
+    # Direct relationships (columns: ITEM_COLUMNS)
+    depends_on: Dict[str, List[Any]] = field(default_factory=_empty_columns(ITEM_COLUMNS))  # Items this depends on
+    depended_by: Dict[str, List[Any]] = field(default_factory=_empty_columns(ITEM_COLUMNS))  # Items that depend on this
     
-    # Table relationships
-    uses_tables: List[Dict[str, Any]] = field(default_factory=list)  # Tables this item uses
-    provides_tables: List[Dict[str, Any]] = field(default_factory=list)  # Tables this item provides
+    # Table relationships (columns: TABLE_COLUMNS)
+    uses_tables: Dict[str, List[Any]] = field(default_factory=_empty_columns(TABLE_COLUMNS))  # Tables this item uses
+    provides_tables: Dict[str, List[Any]] = field(default_factory=_empty_columns(TABLE_COLUMNS))  # Tables this item provides
     
-    # External sources
-    consumes_sources: List[Dict[str, Any]] = field(default_factory=list)  # External sources consumed
+    # External sources (columns: SOURCE_COLUMNS)
+    consumes_sources: Dict[str, List[Any]] = field(default_factory=_empty_columns(SOURCE_COLUMNS))  # External sources consumed
     
     # Chain depths
     upstream_depth: int = 0
     downstream_depth: int = 0
 
 
+@dataclass
+class DependencyCounts:
+    """Relationship counts for an item, without the related nodes themselves."""
+    item_id: str
+    item_name: str
+    item_type: str
+    workspace: str
+    depends_on_count: int = 0
+    depended_by_count: int = 0
+    uses_table_count: int = 0
+    provides_table_count: int = 0
+    consumes_source_count: int = 0
+
+
 class LineageAnalyzer:
     """
     Comprehensive lineage relationship analyzer.
@@ -50,14 +123,36 @@ class LineageAnalyzer:
     your Fabric lineage data through code rather than visualization.
     """
     
-    def __init__(self, neo4j_client):
+    def __init__(self, neo4j_client, cache_ttl_seconds: int = 300, cache_maxsize: int = 256):
         """
         Initialize with a Neo4j client.
         
         Args:
             neo4j_client: Connected Neo4jClient instance
+            cache_ttl_seconds: How long query results (graph-wide aggregates
+                and per-item lookups) are reused before being re-queried
+                (0 disables caching)
+            cache_maxsize: Most query results kept at once; the least
+                recently used is evicted beyond that (0 disables caching)
         """
         self.client = neo4j_client
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_maxsize = cache_maxsize
+        self._cache: OrderedDict[tuple, tuple] = OrderedDict()
+    
+    def clear_cache(self):
+        """Drop all cached query results (call after reloading the graph)."""
+        self._cache.clear()
+    
+    def _store_cached(self, key: tuple, now: float, result: Any):
+        """Store a result, dropping expired entries and then the least recently used."""
+        expired = [k for k, (stored_at, _) in self._cache.items() if now - stored_at >= self.cache_ttl_seconds]
+        for k in expired:
+            del self._cache[k]
+        self._cache[key] = (now, result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_maxsize:
+            self._cache.popitem(last=False)
     
     # =========================================================================
     # SCHEMA-LEVEL ANALYSIS
@@ -79,27 +174,30 @@ class LineageAnalyzer:
         results = self.client.run_query(f"""
             MATCH (t:Table)
             {schema_filter}
+            // Unmatched or unnamed items project to NULL, which collect() skips
+            // (a null or empty name fails "<> ''", so CASE yields NULL)
             OPTIONAL MATCH (t)<-[:USES_TABLE]-(consumer:FabricItem)
+            WITH t, collect(DISTINCT CASE WHEN consumer.name <> ''
+                THEN consumer {{.name, .type, .id}} END) as consumers
             OPTIONAL MATCH (t)<-[:PROVIDES_TABLE]-(provider:FabricItem)
-            WITH t, 
-                 collect(DISTINCT {{name: consumer.name, type: consumer.type, id: consumer.id}}) as consumers,
-                 collect(DISTINCT {{name: provider.name, type: provider.type, id: provider.id}}) as providers
+            WITH t, consumers, collect(DISTINCT CASE WHEN provider.name <> ''
+                THEN provider {{.name, .type, .id}} END) as providers
             RETURN t.schema as schema,
                    t.database as database,
                    t.name as table_name,
                    t.full_path as full_path,
-                   size([c in consumers WHERE c.name IS NOT NULL]) as consumer_count,
-                   size([p in providers WHERE p.name IS NOT NULL]) as provider_count,
-                   [c in consumers WHERE c.name IS NOT NULL] as consumers,
-                   [p in providers WHERE p.name IS NOT NULL] as providers
+                   size(consumers) as consumer_count,
+                   size(providers) as provider_count,
+                   consumers,
+                   providers
             ORDER BY t.schema, t.name
         """, params)
         
-        # Group by schema
-        by_schema = defaultdict(list)
-        for row in results:
-            by_schema[row.get("schema", "UNKNOWN")].append(row)
-        return dict(by_schema)
+        # Rows arrive ORDER BY t.schema, so each schema is one contiguous run
+        return {
+            schema: list(rows)
+            for schema, rows in groupby(results, key=lambda row: row.get("schema", "UNKNOWN"))
+        }
     
     def get_schema_dependencies(self, schema_name: str) -> Dict[str, Any]:
         """
@@ -123,12 +221,16 @@ class LineageAnalyzer:
             OPTIONAL MATCH (t)<-[:USES_TABLE]-(consumer:FabricItem)
             OPTIONAL MATCH (consumer_ws:Workspace)-[:CONTAINS]->(consumer)
             
+            // Unmatched or unnamed nodes project to NULL, which collect() skips
+            // (a null or empty name fails "<> ''", so CASE yields NULL)
             WITH t, provider, ext, consumer, consumer_ws
             RETURN 
-                collect(DISTINCT t.name) as schema_tables,
-                collect(DISTINCT {name: provider.name, type: provider.type}) as providers,
-                collect(DISTINCT {name: ext.display_name, type: ext.type}) as external_sources,
-                collect(DISTINCT {name: consumer.name, type: consumer.type, workspace: consumer_ws.name}) as consumers
+                collect(DISTINCT CASE WHEN t.name <> '' THEN t.name END) as schema_tables,
+                collect(DISTINCT CASE WHEN provider.name <> '' THEN provider {.name, .type} END) as providers,
+                collect(DISTINCT CASE WHEN ext.display_name <> ''
+                    THEN ext {name: ext.display_name, .type} END) as external_sources,
+                collect(DISTINCT CASE WHEN consumer.name <> ''
+                    THEN consumer {.name, .type, workspace: consumer_ws.name} END) as consumers
         """, {"schema": schema_name})
         
         if not results:
@@ -137,65 +239,101 @@ class LineageAnalyzer:
         row = results[0]
         return {
             "schema": schema_name,
-            "tables": [t for t in row.get("schema_tables", []) if t],
-            "providers": [p for p in row.get("providers", []) if p.get("name")],
-            "consumers": [c for c in row.get("consumers", []) if c.get("name")],
-            "external_sources": [e for e in row.get("external_sources", []) if e.get("name")]
+            "tables": row.get("schema_tables", []),
+            "providers": row.get("providers", []),
+            "consumers": row.get("consumers", []),
+            "external_sources": row.get("external_sources", [])
         }
     
     # =========================================================================
     # ITEM-LEVEL ANALYSIS
     # =========================================================================
     
-    def analyze_item(self, item_name: str) -> DependencyInfo:
+    @_ttl_cached
+    def analyze_item(
+        self,
+        item_name: str,
+        counts_only: bool = False
+    ) -> Union[DependencyInfo, DependencyCounts]:
         """
         Get comprehensive dependency information for a specific item.
         
         Args:
             item_name: Name of the Fabric item (Lakehouse, Warehouse, etc.)
+            counts_only: Only count each relationship type instead of
+                returning the related nodes
             
         Returns:
-            DependencyInfo with all relationship details
+            DependencyInfo with all relationship details, or DependencyCounts
+            when counts_only is set
         """
-        # Find the item and all its relationships
+        if counts_only:
+            return self._count_item_dependencies(item_name)
+        
+        # Find the item and all its relationships. Lookups go through the
+        # TEXT-indexed name_lower property (see LineageDataLoader.setup_schema)
+        # rather than toLower(item.name), which forces a full label scan.
         result = self.client.run_query("""
             MATCH (item:FabricItem)
-            WHERE toLower(item.name) CONTAINS toLower($name)
+            WHERE item.name_lower CONTAINS $name
             OPTIONAL MATCH (ws:Workspace)-[:CONTAINS]->(item)
+            WITH item, ws
+            LIMIT 1
+            
+            // Each relationship type is collected in its own subquery so the
+            // matches don't cross-multiply before aggregation
             
             // What this item depends on
-            OPTIONAL MATCH (item)-[:DEPENDS_ON]->(dep:FabricItem)
-            OPTIONAL MATCH (dep_ws:Workspace)-[:CONTAINS]->(dep)
+            CALL {
+                WITH item
+                MATCH (item)-[:DEPENDS_ON]->(dep:FabricItem)
+                WHERE dep.name IS NOT NULL
+                OPTIONAL MATCH (dep_ws:Workspace)-[:CONTAINS]->(dep)
+                RETURN collect(DISTINCT {id: dep.id, name: dep.name, type: dep.type, workspace: dep_ws.name}) as depends_on
+            }
             
             // What depends on this item
-            OPTIONAL MATCH (item)<-[:DEPENDS_ON]-(dependent:FabricItem)
-            OPTIONAL MATCH (dependent_ws:Workspace)-[:CONTAINS]->(dependent)
+            CALL {
+                WITH item
+                MATCH (item)<-[:DEPENDS_ON]-(dependent:FabricItem)
+                WHERE dependent.name IS NOT NULL
+                OPTIONAL MATCH (dependent_ws:Workspace)-[:CONTAINS]->(dependent)
+                RETURN collect(DISTINCT {id: dependent.id, name: dependent.name, type: dependent.type, workspace: dependent_ws.name}) as depended_by
+            }
             
             // Tables used and provided
-            OPTIONAL MATCH (item)-[:USES_TABLE]->(used:Table)
-            OPTIONAL MATCH (item)-[:PROVIDES_TABLE]->(provided:Table)
+            CALL {
+                WITH item
+                MATCH (item)-[:USES_TABLE]->(used:Table)
+                WHERE used.name IS NOT NULL
+                RETURN collect(DISTINCT {name: used.name, schema: used.schema, database: used.database}) as uses_tables
+            }
+            CALL {
+                WITH item
+                MATCH (item)-[:PROVIDES_TABLE]->(provided:Table)
+                WHERE provided.name IS NOT NULL
+                RETURN collect(DISTINCT {name: provided.name, schema: provided.schema, database: provided.database}) as provides_tables
+            }
             
             // External sources consumed
-            OPTIONAL MATCH (item)-[:CONSUMES]->(ext:ExternalSource)
+            CALL {
+                WITH item
+                MATCH (item)-[:CONSUMES]->(ext:ExternalSource)
+                WHERE ext.display_name IS NOT NULL
+                RETURN collect(DISTINCT {name: ext.display_name, type: ext.type, id: ext.id}) as consumes_sources
+            }
             
-            WITH item, ws,
-                 collect(DISTINCT {id: dep.id, name: dep.name, type: dep.type, workspace: dep_ws.name}) as depends_on,
-                 collect(DISTINCT {id: dependent.id, name: dependent.name, type: dependent.type, workspace: dependent_ws.name}) as depended_by,
-                 collect(DISTINCT {name: used.name, schema: used.schema, database: used.database}) as uses_tables,
-                 collect(DISTINCT {name: provided.name, schema: provided.schema, database: provided.database}) as provides_tables,
-                 collect(DISTINCT {name: ext.display_name, type: ext.type, id: ext.id}) as consumes_sources
             RETURN 
                 item.id as item_id,
                 item.name as item_name,
                 item.type as item_type,
                 ws.name as workspace,
-                [d in depends_on WHERE d.name IS NOT NULL] as depends_on,
-                [d in depended_by WHERE d.name IS NOT NULL] as depended_by,
-                [t in uses_tables WHERE t.name IS NOT NULL] as uses_tables,
-                [t in provides_tables WHERE t.name IS NOT NULL] as provides_tables,
-                [s in consumes_sources WHERE s.name IS NOT NULL] as consumes_sources
-            LIMIT 1
-        """, {"name": item_name})
+                depends_on,
+                depended_by,
+                uses_tables,
+                provides_tables,
+                consumes_sources
+        """, {"name": item_name.lower()})
         
         if not result:
             raise ValueError(f"Item '{item_name}' not found")
@@ -206,13 +344,43 @@ class LineageAnalyzer:
             item_name=row.get("item_name", ""),
             item_type=row.get("item_type", ""),
             workspace=row.get("workspace", ""),
-            depends_on=row.get("depends_on", []),
-            depended_by=row.get("depended_by", []),
-            uses_tables=row.get("uses_tables", []),
-            provides_tables=row.get("provides_tables", []),
-            consumes_sources=row.get("consumes_sources", [])
+            depends_on=_to_columns(row.get("depends_on", []), ITEM_COLUMNS),
+            depended_by=_to_columns(row.get("depended_by", []), ITEM_COLUMNS),
+            uses_tables=_to_columns(row.get("uses_tables", []), TABLE_COLUMNS),
+            provides_tables=_to_columns(row.get("provides_tables", []), TABLE_COLUMNS),
+            consumes_sources=_to_columns(row.get("consumes_sources", []), SOURCE_COLUMNS)
         )
     
+    def _count_item_dependencies(self, item_name: str) -> DependencyCounts:
+        """Count an item's relationships without materializing the related nodes."""
+        row = self.client.run_query_single("""
+            MATCH (item:FabricItem)
+            WHERE item.name_lower CONTAINS $name
+            OPTIONAL MATCH (ws:Workspace)-[:CONTAINS]->(item)
+            WITH item, ws
+            LIMIT 1
+            CALL { WITH item MATCH (item)-[:DEPENDS_ON]->(dep:FabricItem) WHERE dep.name IS NOT NULL RETURN count(DISTINCT dep) as depends_on_count }
+            CALL { WITH item MATCH (item)<-[:DEPENDS_ON]-(dependent:FabricItem) WHERE dependent.name IS NOT NULL RETURN count(DISTINCT dependent) as depended_by_count }
+            CALL { WITH item MATCH (item)-[:USES_TABLE]->(used:Table) WHERE used.name IS NOT NULL RETURN count(DISTINCT used) as uses_table_count }
+            CALL { WITH item MATCH (item)-[:PROVIDES_TABLE]->(provided:Table) WHERE provided.name IS NOT NULL RETURN count(DISTINCT provided) as provides_table_count }
+            CALL { WITH item MATCH (item)-[:CONSUMES]->(ext:ExternalSource) WHERE ext.display_name IS NOT NULL RETURN count(DISTINCT ext) as consumes_source_count }
+            RETURN item.id as item_id,
+                   item.name as item_name,
+                   item.type as item_type,
+                   ws.name as workspace,
+                   depends_on_count,
+                   depended_by_count,
+                   uses_table_count,
+                   provides_table_count,
+                   consumes_source_count
+        """, {"name": item_name.lower()})
+        
+        if not row:
+            raise ValueError(f"Item '{item_name}' not found")
+        
+        return DependencyCounts(**row)
+    
+    @_ttl_cached
     def get_item_full_chain(self, item_name: str, max_depth: int = 10) -> Dict[str, Any]:
         """
         Get the complete upstream and downstream chain for an item.
@@ -224,77 +392,92 @@ class LineageAnalyzer:
         Returns:
             Dict with full upstream and downstream chains
         """
-        # Get upstream chain (what this item ultimately depends on)
-        upstream = self.client.run_query(f"""
-            MATCH (start:FabricItem)
-            WHERE toLower(start.name) CONTAINS toLower($name)
-            OPTIONAL MATCH path = (start)-[:DEPENDS_ON|CONSUMES*1..{max_depth}]->(upstream)
-            WHERE upstream:FabricItem OR upstream:ExternalSource
-            WITH DISTINCT upstream, length(path) as depth, labels(upstream)[0] as node_type
-            WHERE upstream IS NOT NULL
-            OPTIONAL MATCH (ws:Workspace)-[:CONTAINS]->(upstream)
-            RETURN upstream.name as name,
-                   upstream.type as type,
-                   node_type,
-                   ws.name as workspace,
-                   depth
-            ORDER BY depth
-        """, {"name": item_name})
+        # Traversal depth is passed as a real parameter through APOC's expandConfig
+        # so the query text stays constant and hits the Cypher plan cache; a
+        # variable-length pattern like *1..N would bake N into the query string.
+        params = {"name": item_name.lower(), "max_depth": max_depth}
         
-        # Get downstream chain (what depends on this item)
-        downstream = self.client.run_query(f"""
+        # Upstream (what this item ultimately depends on) and downstream (what
+        # depends on this item) are fetched in one round trip so the start-node
+        # lookup is only paid once; rows are split by direction below.
+        rows = self.client.run_query("""
             MATCH (start:FabricItem)
-            WHERE toLower(start.name) CONTAINS toLower($name)
-            OPTIONAL MATCH path = (start)<-[:DEPENDS_ON*1..{max_depth}]-(downstream:FabricItem)
-            WITH DISTINCT downstream, length(path) as depth
-            WHERE downstream IS NOT NULL
-            OPTIONAL MATCH (ws:Workspace)-[:CONTAINS]->(downstream)
-            RETURN downstream.name as name,
-                   downstream.type as type,
-                   'FabricItem' as node_type,
+            WHERE start.name_lower CONTAINS $name
+            CALL {
+                WITH start
+                CALL apoc.path.expandConfig(start, {
+                    relationshipFilter: 'DEPENDS_ON>|CONSUMES>',
+                    labelFilter: '+FabricItem|+ExternalSource',
+                    minLevel: 1,
+                    maxLevel: $max_depth,
+                    bfs: true,
+                    uniqueness: 'NODE_GLOBAL'
+                }) YIELD path
+                RETURN 'up' as direction, last(nodes(path)) as node, length(path) as depth
+                UNION
+                WITH start
+                CALL apoc.path.expandConfig(start, {
+                    relationshipFilter: '<DEPENDS_ON',
+                    labelFilter: '+FabricItem',
+                    minLevel: 1,
+                    maxLevel: $max_depth,
+                    bfs: true,
+                    uniqueness: 'NODE_GLOBAL'
+                }) YIELD path
+                RETURN 'down' as direction, last(nodes(path)) as node, length(path) as depth
+            }
+            OPTIONAL MATCH (ws:Workspace)-[:CONTAINS]->(node)
+            RETURN direction,
+                   node.name as name,
+                   node.type as type,
+                   labels(node)[0] as node_type,
                    ws.name as workspace,
                    depth
             ORDER BY depth
-        """, {"name": item_name})
+        """, params)
+        
+        # Rows arrive ORDER BY depth, so each list's last row holds its max depth
+        upstream, downstream = [], []
+        for row in rows:
+            direction = row.pop("direction")
+            (upstream if direction == "up" else downstream).append(row)
         
         return {
             "item": item_name,
             "upstream": upstream,
             "upstream_count": len(upstream),
-            "max_upstream_depth": max(u.get("depth", 0) for u in upstream) if upstream else 0,
+            "max_upstream_depth": upstream[-1]["depth"] if upstream else 0,
             "downstream": downstream,
             "downstream_count": len(downstream),
-            "max_downstream_depth": max(d.get("depth", 0) for d in downstream) if downstream else 0
+            "max_downstream_depth": downstream[-1]["depth"] if downstream else 0
         }
     
     # =========================================================================
     # TYPE-BASED ANALYSIS
     # =========================================================================
     
-    def get_items_by_type(self, item_type: str) -> List[Dict[str, Any]]:
+    @_ttl_cached
+    def get_items_by_type(self, item_type: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get all items of a specific type with their relationships.
         
         Args:
             item_type: Type to filter (Lakehouse, Warehouse, MirroredDatabase, etc.)
+            limit: Optional cap on rows returned, applied in Cypher
             
         Returns:
-            List of items with relationship counts
+            List of items with relationship counts, most connected first
         """
-        return self.client.run_query("""
+        query = """
             MATCH (item:FabricItem {type: $type})
             OPTIONAL MATCH (ws:Workspace)-[:CONTAINS]->(item)
-            OPTIONAL MATCH (item)-[:DEPENDS_ON]->(dep)
-            OPTIONAL MATCH (item)<-[:DEPENDS_ON]-(dependent)
-            OPTIONAL MATCH (item)-[:USES_TABLE]->(uses_t)
-            OPTIONAL MATCH (item)-[:PROVIDES_TABLE]->(provides_t)
-            OPTIONAL MATCH (item)-[:CONSUMES]->(ext)
-            WITH item, ws,
-                 count(DISTINCT dep) as depends_on_count,
-                 count(DISTINCT dependent) as depended_by_count,
-                 count(DISTINCT uses_t) as uses_table_count,
-                 count(DISTINCT provides_t) as provides_table_count,
-                 count(DISTINCT ext) as external_source_count
+            // Count each relationship type in its own subquery so the
+            // OPTIONAL MATCHes don't multiply into a Cartesian fan-out
+            CALL { WITH item MATCH (item)-[:DEPENDS_ON]->(dep) RETURN count(DISTINCT dep) as depends_on_count }
+            CALL { WITH item MATCH (item)<-[:DEPENDS_ON]-(dependent) RETURN count(DISTINCT dependent) as depended_by_count }
+            CALL { WITH item MATCH (item)-[:USES_TABLE]->(uses_t) RETURN count(DISTINCT uses_t) as uses_table_count }
+            CALL { WITH item MATCH (item)-[:PROVIDES_TABLE]->(provides_t) RETURN count(DISTINCT provides_t) as provides_table_count }
+            CALL { WITH item MATCH (item)-[:CONSUMES]->(ext) RETURN count(DISTINCT ext) as external_source_count }
             RETURN item.id as id,
                    item.name as name,
                    item.type as type,
@@ -306,27 +489,33 @@ class LineageAnalyzer:
                    external_source_count,
                    depends_on_count + depended_by_count + external_source_count as total_connections
             ORDER BY total_connections DESC
-        """, {"type": item_type})
+        """
+        params = {"type": item_type}
+        if limit is not None:
+            query += "LIMIT $limit"
+            params["limit"] = limit
+        return self.client.run_query(query, params)
     
-    def get_lakehouses_analysis(self) -> List[Dict[str, Any]]:
+    def get_lakehouses_analysis(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get detailed analysis of all Lakehouses."""
-        return self.get_items_by_type("Lakehouse")
+        return self.get_items_by_type("Lakehouse", limit=limit)
     
-    def get_warehouses_analysis(self) -> List[Dict[str, Any]]:
+    def get_warehouses_analysis(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get detailed analysis of all Warehouses."""
-        return self.get_items_by_type("Warehouse")
+        return self.get_items_by_type("Warehouse", limit=limit)
     
-    def get_mirrored_databases_analysis(self) -> List[Dict[str, Any]]:
+    def get_mirrored_databases_analysis(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get detailed analysis of all MirroredDatabases."""
-        return self.get_items_by_type("MirroredDatabase")
+        return self.get_items_by_type("MirroredDatabase", limit=limit)
     
     # =========================================================================
     # CROSS-ANALYSIS
     # =========================================================================
     
+    @_ttl_cached
     def find_path_between_items(self, source_name: str, target_name: str) -> List[Dict]:
         """
-        Find all paths between two items.
+        Find the shortest lineage paths between two items.
         
         Args:
             source_name: Starting item name
@@ -335,21 +524,39 @@ class LineageAnalyzer:
         Returns:
             List of paths with nodes and relationships
         """
+        # Explicit BFS over lineage relationships only. The built-in
+        # shortestPath over untyped edges also walks CONTAINS, so every pair
+        # in the same workspace short-circuits through the Workspace hub and
+        # the planner cannot prune across 10 hops of arbitrary edges.
         return self.client.run_query("""
-            MATCH (source:FabricItem), (target:FabricItem)
-            WHERE toLower(source.name) CONTAINS toLower($source)
-              AND toLower(target.name) CONTAINS toLower($target)
-            MATCH path = shortestPath((source)-[*..10]-(target))
+            MATCH (source:FabricItem)
+            WHERE source.name_lower CONTAINS $source
+            MATCH (target:FabricItem)
+            WHERE target.name_lower CONTAINS $target
+              AND target <> source
+            CALL apoc.algo.dijkstra(
+                source, target,
+                'DEPENDS_ON|USES_TABLE|PROVIDES_TABLE|CONSUMES|MIRRORS|READS_FROM',
+                '', 1.0
+            ) YIELD path, weight
+            WITH path
+            WHERE length(path) <= 10
             RETURN [n in nodes(path) | {name: n.name, type: coalesce(n.type, labels(n)[0])}] as path_nodes,
                    [r in relationships(path) | type(r)] as relationship_types,
                    length(path) as path_length
             ORDER BY path_length
             LIMIT 5
-        """, {"source": source_name, "target": target_name})
+        """, {"source": source_name.lower(), "target": target_name.lower()})
     
-    def get_cross_workspace_dependencies(self) -> List[Dict]:
-        """Get all dependencies that cross workspace boundaries."""
-        return self.client.run_query("""
+    @_ttl_cached
+    def get_cross_workspace_dependencies(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Get all dependencies that cross workspace boundaries.
+        
+        Args:
+            limit: Optional cap on rows returned, applied in Cypher
+        """
+        query = """
             MATCH (source_ws:Workspace)-[:CONTAINS]->(source:FabricItem)-[:DEPENDS_ON]->(target:FabricItem)<-[:CONTAINS]-(target_ws:Workspace)
             WHERE source_ws <> target_ws
             RETURN source_ws.name as source_workspace,
@@ -359,7 +566,10 @@ class LineageAnalyzer:
                    target.name as target_item,
                    target.type as target_type
             ORDER BY source_ws.name, target_ws.name
-        """)
+        """
+        if limit is None:
+            return self.client.run_query(query)
+        return self.client.run_query(query + "LIMIT $limit", {"limit": limit})
     
     def find_common_dependencies(self, item_names: List[str]) -> Dict[str, Any]:
         """
@@ -371,51 +581,81 @@ class LineageAnalyzer:
         Returns:
             Dict with shared dependencies and unique dependencies per item
         """
-        all_deps = {}
-        for name in item_names:
-            chain = self.get_item_full_chain(name)
-            all_deps[name] = set(u.get("name") for u in chain.get("upstream", []) if u.get("name"))
-        
-        # Find intersection and differences
-        if len(all_deps) >= 2:
-            common = set.intersection(*all_deps.values())
-            unique_per_item = {name: deps - common for name, deps in all_deps.items()}
-        else:
-            common = set()
-            unique_per_item = all_deps
+        names = list(dict.fromkeys(item_names))
+        
+        # Intersect upstream sets in Cypher: group every upstream dependency by
+        # the items that reach it, so only the shared names and the per-item
+        # leftovers come back over the wire.
+        row = self.client.run_query_single("""
+            UNWIND $items AS query
+            MATCH (start:FabricItem)
+            WHERE start.name_lower CONTAINS query.pattern
+            CALL apoc.path.expandConfig(start, {
+                relationshipFilter: 'DEPENDS_ON>|CONSUMES>',
+                labelFilter: '+FabricItem|+ExternalSource',
+                minLevel: 1,
+                maxLevel: $max_depth,
+                bfs: true,
+                uniqueness: 'NODE_GLOBAL'
+            }) YIELD path
+            WITH query.name as item_name, last(nodes(path)).name as dep_name
+            WHERE dep_name IS NOT NULL
+            WITH dep_name, collect(DISTINCT item_name) as seen_by
+            WITH dep_name, seen_by, size($items) >= 2 AND size(seen_by) = size($items) as shared
+            RETURN collect(CASE WHEN shared THEN dep_name END) as common,
+                   collect(CASE WHEN NOT shared THEN {name: dep_name, seen_by: seen_by} END) as partial
+        """, {
+            "items": [{"name": name, "pattern": name.lower()} for name in names],
+            "max_depth": 10
+        }) or {}
+        
+        common = row.get("common", [])
+        unique_per_item = {name: [] for name in names}
+        for dep in row.get("partial", []):
+            for name in dep["seen_by"]:
+                unique_per_item[name].append(dep["name"])
         
         return {
             "items_analyzed": item_names,
-            "common_dependencies": list(common),
+            "common_dependencies": common,
             "common_count": len(common),
-            "unique_per_item": {k: list(v) for k, v in unique_per_item.items()}
+            "unique_per_item": unique_per_item
         }
     
     # =========================================================================
     # SUMMARY REPORTS
     # =========================================================================
     
+    @_ttl_cached
     def get_overview(self) -> Dict[str, Any]:
         """Get a high-level overview of the entire lineage graph."""
-        stats = self.client.run_query_single("""
-            MATCH (n)
-            WITH labels(n)[0] as node_type, count(n) as count
-            RETURN collect({type: node_type, count: count}) as node_counts
-        """)
-        
-        relationships = self.client.run_query("""
-            MATCH ()-[r]->()
-            RETURN type(r) as rel_type, count(r) as count
-            ORDER BY count DESC
-        """)
-        
-        workspaces = self.client.run_query("""
-            MATCH (w:Workspace)
-            OPTIONAL MATCH (w)-[:CONTAINS]->(item)
-            WITH w, count(item) as item_count
-            RETURN w.name as workspace, item_count
-            ORDER BY item_count DESC
-        """)
+        # The three scans are independent; run_query opens a session per call
+        # and the driver is thread-safe, so issue them concurrently.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Materialized analytics views are not lineage nodes
+            stats_future = executor.submit(self.client.run_query_single, """
+                MATCH (n) WHERE NOT n:MaterializedView
+                WITH labels(n)[0] as node_type, count(n) as count
+                RETURN collect({type: node_type, count: count}) as node_counts
+            """)
+            
+            relationships_future = executor.submit(self.client.run_query, """
+                MATCH ()-[r]->()
+                RETURN type(r) as rel_type, count(r) as count
+                ORDER BY count DESC
+            """)
+            
+            workspaces_future = executor.submit(self.client.run_query, """
+                MATCH (w:Workspace)
+                OPTIONAL MATCH (w)-[:CONTAINS]->(item)
+                WITH w, count(item) as item_count
+                RETURN w.name as workspace, item_count
+                ORDER BY item_count DESC
+            """)
+            
+            stats = stats_future.result()
+            relationships = relationships_future.result()
+            workspaces = workspaces_future.result()
         
         return {
             "node_counts": stats.get("node_counts", []) if stats else [],
@@ -445,42 +685,42 @@ class LineageAnalyzer:
         
         # Lakehouses
         lines.extend(["", "---", "", "## Lakehouses Analysis", ""])
-        lakehouses = self.get_lakehouses_analysis()
+        lakehouses = self.get_lakehouses_analysis(limit=15)
         if lakehouses:
             lines.extend(["| Name | Workspace | Uses Tables | Provides Tables | External Sources |",
                           "|------|-----------|-------------|-----------------|------------------|"])
-            for lh in lakehouses[:15]:
+            for lh in lakehouses:
                 lines.append(f"| {lh.get('name', 'N/A')} | {lh.get('workspace', '-')} | "
                              f"{lh.get('uses_table_count', 0)} | {lh.get('provides_table_count', 0)} | "
                              f"{lh.get('external_source_count', 0)} |")
         
         # Warehouses
         lines.extend(["", "---", "", "## Warehouses Analysis", ""])
-        warehouses = self.get_warehouses_analysis()
+        warehouses = self.get_warehouses_analysis(limit=15)
         if warehouses:
             lines.extend(["| Name | Workspace | Dependencies | Dependents |",
                           "|------|-----------|--------------|------------|"])
-            for wh in warehouses[:15]:
+            for wh in warehouses:
                 lines.append(f"| {wh.get('name', 'N/A')} | {wh.get('workspace', '-')} | "
                              f"{wh.get('depends_on_count', 0)} | {wh.get('depended_by_count', 0)} |")
         
         # MirroredDatabases
         lines.extend(["", "---", "", "## MirroredDatabases Analysis", ""])
-        mirroreds = self.get_mirrored_databases_analysis()
+        mirroreds = self.get_mirrored_databases_analysis(limit=15)
         if mirroreds:
             lines.extend(["| Name | Workspace | Provides Tables | External Sources |",
                           "|------|-----------|-----------------|------------------|"])
-            for md in mirroreds[:15]:
+            for md in mirroreds:
                 lines.append(f"| {md.get('name', 'N/A')} | {md.get('workspace', '-')} | "
                              f"{md.get('provides_table_count', 0)} | {md.get('external_source_count', 0)} |")
         
         # Cross-workspace dependencies
         lines.extend(["", "---", "", "## Cross-Workspace Dependencies", ""])
-        cross = self.get_cross_workspace_dependencies()
+        cross = self.get_cross_workspace_dependencies(limit=20)
         if cross:
             lines.extend(["| Source Workspace | Source Item | → | Target Workspace | Target Item |",
                           "|------------------|-------------|---|------------------|-------------|"])
-            for dep in cross[:20]:
+            for dep in cross:
                 lines.append(f"| {dep.get('source_workspace', '-')} | {dep.get('source_item', '-')} | → | "
                              f"{dep.get('target_workspace', '-')} | {dep.get('target_item', '-')} |")
         
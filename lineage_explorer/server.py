@@ -19,20 +19,39 @@ Extended Endpoints (see api_extended.py):
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
-import pandas as pd
-import glob
+from fastapi.responses import FileResponse, JSONResponse, Response
+import asyncio
+import gzip
+import hashlib
+import json
 import os
+import shutil
+import threading
 import time
 import logging
+import uuid
 from pathlib import Path
+from collections import Counter, OrderedDict, deque
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 
-# Load .env file for environment variables (including NEO4J_PASSWORD)
-try:
-    from dotenv import load_dotenv
+from .graph_builder import (
+    build_graph_from_csv, build_graph_from_json, build_graph,
+    compute_graph_stats, export_graph_to_json
+)
+from .models import LineageGraph, GraphStats
+
+
+def _load_env():
+    """Load .env file for environment variables (including NEO4J_PASSWORD)."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        logging.warning("python-dotenv not installed - environment variables must be set manually")
+        return
     # Try to load from project root first, then from lineage_explorer directory
     env_paths = [
         Path(__file__).resolve().parent.parent / ".env",  # PROJECT_ROOT/.env
@@ -43,14 +62,9 @@ try:
             load_dotenv(env_path)
             logging.info(f"Loaded environment from {env_path}")
             break
-except ImportError:
-    logging.warning("python-dotenv not installed - environment variables must be set manually")
 
-from .graph_builder import (
-    build_graph_from_csv, build_graph_from_json, build_graph,
-    compute_graph_stats, export_graph_to_json
-)
-from .models import LineageGraph, GraphStats
+
+_load_env()
 
 # Configure logging
 logging.basicConfig(
@@ -66,60 +80,313 @@ EXPORT_DIR = PROJECT_ROOT / "exports" / "lineage"
 FRONTEND_DIR = BASE_DIR / "static"
 
 
+@dataclass(frozen=True)
+class GraphPayload:
+    """
+    One refresh's serialized /api/graph response.
+    
+    Published with a single attribute assignment, so a request that reads it
+    once always pairs the ETag with the matching body. When spilled to disk the
+    byte fields are None and the paths are set.
+    """
+    etag: str
+    json_bytes: Optional[bytes] = None
+    gzip_bytes: Optional[bytes] = None
+    json_path: Optional[Path] = None
+    gzip_path: Optional[Path] = None
+    
+    @property
+    def spill_paths(self) -> tuple[Path, ...]:
+        return tuple(path for path in (self.json_path, self.gzip_path) if path is not None)
+
+
+@dataclass(frozen=True)
+class StatsPayload:
+    """One refresh's serialized /api/stats response, published like GraphPayload."""
+    etag: str
+    json_bytes: bytes
+
+
 class GraphCache:
-    """In-memory cache for the lineage graph."""
+    """In-memory cache for the lineage graph (graph payloads optionally spilled to disk)."""
     
-    def __init__(self, ttl_seconds: int = 300):
+    # Retired spill files are kept at least this long (seconds) after being
+    # replaced, so responses that already picked up the old payload can still
+    # open and send them
+    SPILL_GRACE_SECONDS = 60.0
+    # Without a way to probe other processes (Windows), another process's spill
+    # directory is only treated as abandoned once it is this old (seconds)
+    STALE_SPILL_DIR_SECONDS = 24 * 3600
+    
+    def __init__(self, ttl_seconds: int = 300, spill_root: Optional[Path] = None):
         self.graph: Optional[LineageGraph] = None
         self.stats: Optional[GraphStats] = None
-        self.loaded_at: Optional[datetime] = None
+        self.loaded_at: Optional[datetime] = None  # Wall-clock, for display only
+        self.loaded_monotonic: Optional[float] = None  # Used for TTL math
         self.source_file: Optional[str] = None
         self.source_mtime: Optional[float] = None
         self.ttl_seconds = ttl_seconds
+        # The source file's mtime is stat()ed at most this often (seconds), so
+        # request handlers don't hit the filesystem on every call
+        self.source_check_interval: float = 1.0
+        self._source_checked_at: Optional[float] = None
         self.load_time_ms: float = 0
+        # Serialized once per refresh and served as-is by /api/graph, /api/stats
+        # and /api/workspaces
+        self.graph_payload: Optional[GraphPayload] = None
+        self.stats_payload: Optional[StatsPayload] = None
+        self.workspaces_json_bytes: Optional[bytes] = None
+        # When spill_root is set, the graph payloads are written to a directory
+        # of their own under it ("<pid>-<random>") and served with FileResponse
+        # (sendfile) instead of being held in memory. Other processes sharing
+        # the export dir use their own directories, so a process only ever
+        # deletes files it wrote itself.
+        self.spill_root = spill_root
+        self._spill_dir: Optional[Path] = None
+        self._spill_dir_pid: Optional[int] = None
+        # (retired at, paths) for the spill files of replaced payloads; deleted
+        # once SPILL_GRACE_SECONDS have passed
+        self._retired_spill_paths: list[tuple[float, tuple[Path, ...]]] = []
+        self.health_payload_bytes: bytes = b""
+        self._update_health_payload()
     
     def is_valid(self) -> bool:
         if self.graph is None or self.source_file is None:
             return False
         
-        try:
-            current_mtime = os.path.getmtime(self.source_file)
-            if current_mtime != self.source_mtime:
-                logger.info("Source file modified, cache invalidated")
+        now = time.monotonic()
+        if self._source_checked_at is None or now - self._source_checked_at >= self.source_check_interval:
+            try:
+                current_mtime = os.path.getmtime(self.source_file)
+                if current_mtime != self.source_mtime:
+                    logger.info("Source file modified, cache invalidated")
+                    return False
+            except OSError:
                 return False
-        except OSError:
-            return False
+            self._source_checked_at = now
         
-        if self.loaded_at:
-            age = (datetime.now() - self.loaded_at).total_seconds()
+        if self.loaded_monotonic is not None:
+            age = now - self.loaded_monotonic
             if age > self.ttl_seconds:
                 logger.info(f"Cache TTL expired ({age:.0f}s > {self.ttl_seconds}s)")
                 return False
         
         return True
     
+    def is_current_source(self, file_path: Path) -> bool:
+        """True if file_path is the cached source file and it hasn't been modified."""
+        if self.graph is None or str(file_path) != self.source_file:
+            return False
+        try:
+            return os.path.getmtime(file_path) == self.source_mtime
+        except OSError:
+            return False
+    
+    def touch(self):
+        """Restart the TTL for a graph whose source is known to be unchanged."""
+        self.loaded_at = datetime.now()
+        self.loaded_monotonic = time.monotonic()
+        self._source_checked_at = self.loaded_monotonic
+        self._update_health_payload()
+    
     def set(self, graph: LineageGraph, stats: GraphStats, source_file: str, load_time_ms: float):
         self.graph = graph
         self.stats = stats
         self.source_file = source_file
         self.source_mtime = os.path.getmtime(source_file)
         self.loaded_at = datetime.now()
+        self.loaded_monotonic = time.monotonic()
+        self._source_checked_at = self.loaded_monotonic
         self.load_time_ms = load_time_ms
+        self._publish_graph_payload(self._build_graph_payload(graph))
+        stats_json_bytes = stats.model_dump_json().encode("utf-8")
+        self.stats_payload = StatsPayload(f'"{hashlib.sha256(stats_json_bytes).hexdigest()}"', stats_json_bytes)
+        self.workspaces_json_bytes = self._serialize_workspaces(graph)
+        self._update_health_payload()
         logger.info(f"Cache updated: {graph.total_items} items, {graph.total_connections} edges (loaded in {load_time_ms:.0f}ms)")
     
+    @staticmethod
+    def _serialize_workspaces(graph: LineageGraph) -> bytes:
+        """Build the /api/workspaces payload (workspaces with item counts, by name)."""
+        item_counts = Counter(item.workspace_id for item in graph.items)
+        workspaces = [
+            {
+                "id": ws.id,
+                "name": ws.name,
+                "item_count": item_counts.get(ws.id, 0)
+            }
+            for ws in sorted(graph.workspaces, key=attrgetter("name"))
+        ]
+        return json.dumps({"workspaces": workspaces}, separators=(",", ":")).encode("utf-8")
+    
+    @property
+    def spill_dir(self) -> Optional[Path]:
+        """This process's spill directory (a new one after a fork), or None when not spilling."""
+        if self.spill_root is None:
+            return None
+        pid = os.getpid()
+        if self._spill_dir is None or self._spill_dir_pid != pid:
+            self._spill_dir = self.spill_root / f"{pid}-{uuid.uuid4().hex[:8]}"
+            self._spill_dir_pid = pid
+            self._retired_spill_paths = []
+        return self._spill_dir
+    
+    def _build_graph_payload(self, graph: LineageGraph) -> GraphPayload:
+        """
+        Serialize and gzip the graph, spilling both to spill_dir when set.
+        
+        Spill files are named after the ETag and written via a temp file and
+        os.replace, so a file is never seen half-written. On any OS error the
+        payload simply stays in memory.
+        """
+        json_bytes = graph.model_dump_json().encode("utf-8")
+        gzip_bytes = gzip.compress(json_bytes, compresslevel=6)
+        etag = f'"{hashlib.sha256(json_bytes).hexdigest()}"'
+        spill_dir = self.spill_dir
+        if spill_dir is None:
+            return GraphPayload(etag, json_bytes=json_bytes, gzip_bytes=gzip_bytes)
+        
+        digest = etag.strip('"')[:16]
+        json_path = spill_dir / f"graph-{digest}.json"
+        gzip_path = spill_dir / f"graph-{digest}.json.gz"
+        try:
+            spill_dir.mkdir(parents=True, exist_ok=True)
+            for path, content in ((json_path, json_bytes), (gzip_path, gzip_bytes)):
+                tmp_path = path.with_name(f"{path.name}.tmp")
+                tmp_path.write_bytes(content)
+                os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write graph payload to {spill_dir}, serving from memory: {e}")
+            return GraphPayload(etag, json_bytes=json_bytes, gzip_bytes=gzip_bytes)
+        return GraphPayload(etag, json_path=json_path, gzip_path=gzip_path)
+    
+    def _publish_graph_payload(self, payload: Optional[GraphPayload]):
+        """
+        Swap in a new graph payload (None to drop it) with one assignment.
+        
+        The replaced payload's spill files are retired and deleted on a later
+        publish, once SPILL_GRACE_SECONDS have passed; a retired file that the
+        new payload reuses (same content, same name) is never deleted.
+        """
+        previous = self.graph_payload
+        self.graph_payload = payload
+        now = time.monotonic()
+        keep = set(payload.spill_paths) if payload is not None else set()
+        if previous is not None and previous.spill_paths:
+            self._retired_spill_paths.append((now, previous.spill_paths))
+        
+        still_retired = []
+        for retired_at, paths in self._retired_spill_paths:
+            paths = tuple(path for path in paths if path not in keep)
+            if not paths:
+                continue
+            if now - retired_at < self.SPILL_GRACE_SECONDS:
+                still_retired.append((retired_at, paths))
+                continue
+            for path in paths:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        self._retired_spill_paths = still_retired
+    
+    def remove_spill_dir(self):
+        """Delete this process's spill directory (on shutdown); the payload falls back to memory."""
+        spill_dir = self._spill_dir
+        if spill_dir is None or self._spill_dir_pid != os.getpid():
+            return
+        self.graph_payload = None
+        self._retired_spill_paths = []
+        shutil.rmtree(spill_dir, ignore_errors=True)
+    
+    def sweep_stale_spill_dirs(self):
+        """
+        Remove spill directories left behind by processes that have exited.
+        
+        Directories are named "<pid>-<random>"; one is stale when its pid is no
+        longer running. Where that can't be checked (Windows), it is stale once
+        it hasn't been written to for STALE_SPILL_DIR_SECONDS. Files spilled
+        directly into spill_root by earlier versions are removed as well.
+        """
+        if self.spill_root is None or not self.spill_root.is_dir():
+            return
+        own_dir = self._spill_dir if self._spill_dir_pid == os.getpid() else None
+        try:
+            entries = list(os.scandir(self.spill_root))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.name.startswith("graph-"):
+                    os.unlink(entry.path)
+                elif entry.is_dir() and Path(entry.path) != own_dir and self._is_stale_spill_dir(entry):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                    logger.info(f"Removed stale graph cache directory {entry.path}")
+            except OSError:
+                continue
+    
+    def _is_stale_spill_dir(self, entry: os.DirEntry) -> bool:
+        pid_text = entry.name.split("-", 1)[0]
+        if not pid_text.isdigit():
+            return False
+        if os.name != "nt":
+            try:
+                os.kill(int(pid_text), 0)
+            except ProcessLookupError:
+                return True
+            except OSError:
+                return False  # Exists but owned by someone else (EPERM)
+            return False
+        return time.time() - entry.stat().st_mtime > self.STALE_SPILL_DIR_SECONDS
+    
+    def _update_health_payload(self):
+        """Rebuild the /api/health payload; it only changes when the cache does."""
+        payload = {
+            "status": "healthy",
+            "version": "1.0.0",
+            "cached": self.graph is not None,
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+            # Note: source_file path removed for security - use /api/health/debug in development
+        }
+        self.health_payload_bytes = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    
     def clear(self):
         self.graph = None
         self.stats = None
         self.loaded_at = None
+        self.loaded_monotonic = None
+        self._source_checked_at = None
+        self._publish_graph_payload(None)
+        self.stats_payload = None
+        self.workspaces_json_bytes = None
+        self._update_health_payload()
         logger.info("Cache cleared")
 
 
 # Global cache
-_cache = GraphCache(ttl_seconds=300)
+_cache = GraphCache(ttl_seconds=300, spill_root=EXPORT_DIR / ".cache")
+
+# Last find_lineage_file() result and when it was resolved (monotonic seconds).
+# Reused for a few seconds so bursts of cache misses don't each rescan the
+# export directories.
+_file_path_cache: Optional[tuple[Path, float]] = None
+_FILE_PATH_CACHE_TTL = 5.0
+
+
+def _match_shallow(entry: os.DirEntry, prefix: str, suffix: str) -> bool:
+    """Match a DirEntry against a single-level 'prefix*suffix' wildcard without fnmatch/regex."""
+    return entry.name.startswith(prefix) and entry.name.endswith(suffix)
 
 
 def find_lineage_file() -> Path:
     """Find the most recent lineage JSON or CSV file (prefers JSON)."""
+    global _file_path_cache
+    
+    if _file_path_cache is not None:
+        cached_path, resolved_at = _file_path_cache
+        if time.monotonic() - resolved_at < _FILE_PATH_CACHE_TTL:
+            return cached_path
+    
     search_paths = [EXPORT_DIR]
     
     cwd_export = Path("exports/lineage")
@@ -130,32 +397,55 @@ def find_lineage_file() -> Path:
         if not search_path.exists():
             continue
         
-        # Prefer JSON files (native format)
-        json_files = glob.glob(str(search_path / "lineage_*.json"))
-        if json_files:
-            return Path(max(json_files, key=os.path.getmtime))
+        # One directory pass: DirEntry.stat() is cached, so each candidate is
+        # stat'ed at most once. Track the newest JSON (native format) and the
+        # largest mirrored/any CSV (legacy fallback) at the same time.
+        newest_json, newest_json_mtime = None, -1.0
+        largest_mirrored_csv, largest_mirrored_size = None, -1
+        largest_csv, largest_csv_size = None, -1
         
-        # Fallback to CSV (legacy format)
-        csv_files = glob.glob(str(search_path / "mirrored_lineage_*.csv"))
-        if not csv_files:
-            csv_files = glob.glob(str(search_path / "*.csv"))
+        with os.scandir(search_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if _match_shallow(entry, "lineage_", ".json"):
+                    mtime = entry.stat().st_mtime
+                    if mtime > newest_json_mtime:
+                        newest_json, newest_json_mtime = entry.path, mtime
+                elif newest_json is None and _match_shallow(entry, "", ".csv") and not entry.name.startswith("."):
+                    size = entry.stat().st_size
+                    if size > largest_csv_size:
+                        largest_csv, largest_csv_size = entry.path, size
+                    if _match_shallow(entry, "mirrored_lineage_", ".csv") and size > largest_mirrored_size:
+                        largest_mirrored_csv, largest_mirrored_size = entry.path, size
         
-        if csv_files:
-            return Path(max(csv_files, key=os.path.getsize))
+        best = newest_json or largest_mirrored_csv or largest_csv
+        if best:
+            _file_path_cache = (Path(best), time.monotonic())
+            return _file_path_cache[0]
     
     raise FileNotFoundError(f"No lineage JSON/CSV found in: {search_paths}")
 
 
 def load_graph(force_refresh: bool = False) -> tuple[LineageGraph, GraphStats]:
     """Load graph data, using cache when available."""
-    global _cache
+    global _cache, _file_path_cache
     
     if not force_refresh and _cache.is_valid():
         return _cache.graph, _cache.stats
     
+    if force_refresh:
+        _file_path_cache = None  # pick up newly exported files immediately
+    
     start_time = time.time()
     
     file_path = find_lineage_file()
+    
+    # TTL expired but the newest file is still the one we loaded: keep the graph
+    if not force_refresh and _cache.is_current_source(file_path):
+        _cache.touch()
+        return _cache.graph, _cache.stats
+    
     logger.info(f"Loading: {file_path} ({os.path.getsize(file_path)} bytes)")
     
     graph = build_graph(file_path)  # Auto-detects JSON vs CSV
@@ -167,6 +457,49 @@ def load_graph(force_refresh: bool = False) -> tuple[LineageGraph, GraphStats]:
     return graph, stats
 
 
+# Serializes cache rebuilds triggered from request handlers
+_load_lock = asyncio.Lock()
+# In-flight stale-while-revalidate refresh, if any
+_refresh_task: Optional[asyncio.Task] = None
+
+
+async def _refresh_in_background():
+    """Revalidate a stale cache without holding up the request that noticed it."""
+    try:
+        async with _load_lock:
+            if not _cache.is_valid():
+                await asyncio.to_thread(load_graph)
+    except Exception as e:
+        logger.error(f"Background graph refresh failed: {e}", exc_info=True)
+
+
+async def load_graph_async(force_refresh: bool = False) -> tuple[LineageGraph, GraphStats]:
+    """
+    Event-loop friendly load_graph for request handlers.
+    
+    A valid cache is returned without locking. A stale cache (TTL expired or
+    source changed) is served as-is while a single background task
+    revalidates it. Only a cold cache or a forced refresh blocks; the rebuild
+    then runs in a worker thread so the loop keeps serving other requests, and
+    concurrent misses wait for one rebuild instead of each starting their own.
+    """
+    global _refresh_task
+    
+    if not force_refresh and _cache.is_valid():
+        return _cache.graph, _cache.stats
+    
+    if not force_refresh and _cache.graph is not None:
+        if _refresh_task is None or _refresh_task.done():
+            _refresh_task = asyncio.create_task(_refresh_in_background())
+        return _cache.graph, _cache.stats
+    
+    async with _load_lock:
+        # Another request may have rebuilt the cache while we waited
+        if not force_refresh and _cache.is_valid():
+            return _cache.graph, _cache.stats
+        return await asyncio.to_thread(load_graph, force_refresh)
+
+
 # FastAPI App
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -175,6 +508,7 @@ async def lifespan(app: FastAPI):
     logger.info(f"Project root: {PROJECT_ROOT}")
     logger.info(f"Export dir: {EXPORT_DIR}")
     
+    _cache.sweep_stale_spill_dirs()
     try:
         load_graph()
         logger.info("Initial cache loaded successfully")
@@ -195,8 +529,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Could not pre-load cache: {e}")
     
+    janitor = asyncio.create_task(_rate_limit_janitor())
+    
     yield
     
+    janitor.cancel()
+    _cache.remove_spill_dir()
+    
     # Cleanup Neo4j connection
     try:
         from .api_extended import _neo4j_client
@@ -239,7 +578,17 @@ app.add_middleware(
 
 
 # Simple in-memory rate limiting for sensitive endpoints
-_rate_limit_store: dict = {}
+# Each key holds a deque of request times (monotonic seconds), oldest first.
+# Keys are spread over lock-protected shards so concurrent checks (e.g. from
+# threadpool-run handlers) only contend when they hash to the same shard.
+_RATE_LIMIT_SHARDS = 16
+# Hard cap on tracked client:endpoint keys; each shard evicts its least
+# recently seen key beyond its share, so rotating IPs can't grow the store
+_RATE_LIMIT_MAX_KEYS = 100_000
+_RATE_LIMIT_SHARD_MAX_KEYS = _RATE_LIMIT_MAX_KEYS // _RATE_LIMIT_SHARDS
+_rate_limit_store: list[tuple[threading.Lock, OrderedDict[str, deque]]] = [
+    (threading.Lock(), OrderedDict()) for _ in range(_RATE_LIMIT_SHARDS)
+]
 _rate_limit_window = 60  # seconds
 _rate_limit_max_requests = int(os.getenv("RATE_LIMIT_MAX", "30"))  # requests per window
 
@@ -249,37 +598,67 @@ def check_rate_limit(client_ip: str, endpoint: str) -> bool:
     
     Returns True if request should be allowed, False if rate limited.
     """
-    import time
     key = f"{client_ip}:{endpoint}"
-    now = time.time()
-    
-    # Clean old entries
-    if key in _rate_limit_store:
-        requests = [t for t in _rate_limit_store[key] if now - t < _rate_limit_window]
-        _rate_limit_store[key] = requests
-    else:
-        _rate_limit_store[key] = []
+    lock, shard = _rate_limit_store[hash(key) % _RATE_LIMIT_SHARDS]
     
-    # Check limit
-    if len(_rate_limit_store[key]) >= _rate_limit_max_requests:
-        return False
+    with lock:
+        now = time.monotonic()
+        
+        timestamps = shard.get(key)
+        if timestamps is None:
+            timestamps = shard[key] = deque()
+            if len(shard) > _RATE_LIMIT_SHARD_MAX_KEYS:
+                shard.popitem(last=False)
+        else:
+            shard.move_to_end(key)
+        
+        # Evict requests that have left the rolling window
+        cutoff = now - _rate_limit_window
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+        
+        # Check limit
+        if len(timestamps) >= _rate_limit_max_requests:
+            return False
+        
+        # Record request
+        timestamps.append(now)
+        return True
+
+
+def prune_rate_limit_store() -> int:
+    """
+    Drop rate-limit keys whose requests have all left the window.
     
-    # Record request
-    _rate_limit_store[key].append(now)
-    return True
+    Returns:
+        Number of keys removed
+    """
+    removed = 0
+    for lock, shard in _rate_limit_store:
+        with lock:
+            cutoff = time.monotonic() - _rate_limit_window
+            expired = [key for key, timestamps in shard.items()
+                       if not timestamps or timestamps[-1] <= cutoff]
+            for key in expired:
+                del shard[key]
+            removed += len(expired)
+    return removed
+
+
+async def _rate_limit_janitor():
+    """Periodically prune idle rate-limit keys so the store stays bounded."""
+    while True:
+        await asyncio.sleep(_rate_limit_window)
+        removed = prune_rate_limit_store()
+        if removed:
+            logger.debug(f"Pruned {removed} idle rate-limit keys")
 
 
 # API Endpoints
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "cached": _cache.graph is not None,
-        "loaded_at": _cache.loaded_at.isoformat() if _cache.loaded_at else None,
-        # Note: source_file path removed for security - use /api/health/debug in development
-    }
+    return Response(content=_cache.health_payload_bytes, media_type="application/json")
 
 
 @app.get("/api/health/debug")
@@ -305,11 +684,35 @@ async def health_check_debug():
 
 
 @app.get("/api/graph")
-async def get_graph():
-    """Get the full lineage graph."""
+async def get_graph(request: Request):
+    """
+    Get the full lineage graph.
+    
+    Served from the payload cached at refresh time (from disk via sendfile when
+    spilled): gzip-compressed when the client accepts it, and 304 Not Modified
+    when If-None-Match matches. Cache-Control: no-cache lets browsers keep the
+    payload but revalidate it on every use.
+    """
     try:
-        graph, _ = load_graph()
-        return graph.model_dump(mode='json')
+        await load_graph_async()
+        # Read the payload once: a concurrent refresh swaps in a new one, and
+        # the ETag must always match the body sent with it
+        payload = _cache.graph_payload
+        if payload is None:
+            raise HTTPException(status_code=503, detail="Graph is being reloaded, retry shortly")
+        headers = {"ETag": payload.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if request.headers.get("if-none-match") == payload.etag:
+            return Response(status_code=304, headers=headers)
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            if payload.gzip_path is not None:
+                return FileResponse(payload.gzip_path, media_type="application/json", headers=headers)
+            return Response(content=payload.gzip_bytes, media_type="application/json", headers=headers)
+        if payload.json_path is not None:
+            return FileResponse(payload.json_path, media_type="application/json", headers=headers)
+        return Response(content=payload.json_bytes, media_type="application/json", headers=headers)
+    except HTTPException:
+        raise
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -318,11 +721,20 @@ async def get_graph():
 
 
 @app.get("/api/stats")
-async def get_stats():
-    """Get graph statistics."""
+async def get_stats(request: Request):
+    """Get graph statistics (ETag/304 revalidation, like /api/graph)."""
     try:
-        _, stats = load_graph()
-        return stats.model_dump()
+        await load_graph_async()
+        # Read once so the ETag always matches the body (see get_graph)
+        payload = _cache.stats_payload
+        if payload is None:
+            raise HTTPException(status_code=503, detail="Graph is being reloaded, retry shortly")
+        headers = {"ETag": payload.etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == payload.etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=payload.json_bytes, media_type="application/json", headers=headers)
+    except HTTPException:
+        raise
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -334,24 +746,13 @@ async def get_stats():
 async def list_workspaces():
     """List all workspaces with item counts."""
     try:
-        graph, _ = load_graph()
-        
-        # Count items per workspace
-        item_counts = {}
-        for item in graph.items:
-            ws_id = item.workspace_id
-            item_counts[ws_id] = item_counts.get(ws_id, 0) + 1
-        
-        workspaces = [
-            {
-                "id": ws.id,
-                "name": ws.name,
-                "item_count": item_counts.get(ws.id, 0)
-            }
-            for ws in sorted(graph.workspaces, key=lambda w: w.name)
-        ]
-        
-        return {"workspaces": workspaces}
+        await load_graph_async()
+        workspaces_json_bytes = _cache.workspaces_json_bytes
+        if workspaces_json_bytes is None:
+            raise HTTPException(status_code=503, detail="Graph is being reloaded, retry shortly")
+        return Response(content=workspaces_json_bytes, media_type="application/json")
+    except HTTPException:
+        raise
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -366,7 +767,7 @@ async def refresh_graph(request: Request):
     
     try:
         _cache.clear()
-        graph, stats = load_graph(force_refresh=True)
+        graph, stats = await load_graph_async(force_refresh=True)
         return {
             "status": "refreshed",
             "items": graph.total_items,
@@ -379,85 +780,11 @@ async def refresh_graph(request: Request):
 
 
 # Serve static frontend (unified single-page visualization)
-@app.get("/")
-async def serve_frontend():
-    """Serve the unified lineage explorer frontend."""
-    index_path = FRONTEND_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
-    raise HTTPException(status_code=404, detail="Frontend not found")
-
-
-@app.get("/dashboard.html")
-async def serve_dashboard():
-    """Serve the statistics dashboard."""
-    dashboard_path = FRONTEND_DIR / "dashboard.html"
-    if dashboard_path.exists():
-        return FileResponse(dashboard_path)
-    raise HTTPException(status_code=404, detail="Dashboard not found")
-
-
-@app.get("/query_explorer.html")
-async def serve_query_explorer():
-    """Serve the Neo4j query explorer."""
-    explorer_path = FRONTEND_DIR / "query_explorer.html"
-    if explorer_path.exists():
-        return FileResponse(explorer_path)
-    raise HTTPException(status_code=404, detail="Query explorer not found")
-
-
-@app.get("/table_impact.html")
-async def serve_table_impact():
-    """Serve the table impact analysis dashboard."""
-    impact_path = FRONTEND_DIR / "table_impact.html"
-    if impact_path.exists():
-        return FileResponse(impact_path)
-    raise HTTPException(status_code=404, detail="Table impact page not found")
-
-
-@app.get("/tables_graph.html")
-async def serve_tables_graph():
-    """Serve the specialized Tables Graph visualization."""
-    graph_path = FRONTEND_DIR / "tables_graph.html"
-    if graph_path.exists():
-        return FileResponse(graph_path)
-    raise HTTPException(status_code=404, detail="Tables graph page not found")
-
-
-@app.get("/elements_graph.html")
-async def serve_elements_graph():
-    """Serve the specialized Elements Graph visualization."""
-    graph_path = FRONTEND_DIR / "elements_graph.html"
-    if graph_path.exists():
-        return FileResponse(graph_path)
-    raise HTTPException(status_code=404, detail="Elements graph page not found")
-
-
-# Serve static files from root path (for index-v3.html which uses relative paths)
-@app.get("/{filename:path}")
-async def serve_root_static(filename: str):
-    """Serve static files from root path for relative imports in HTML."""
-    # Skip API routes
-    if filename.startswith("api/"):
-        raise HTTPException(status_code=404, detail="Not found")
-    
-    # Security: Resolve path and ensure it's within FRONTEND_DIR
-    try:
-        file_path = (FRONTEND_DIR / filename).resolve()
-        frontend_resolved = FRONTEND_DIR.resolve()
-        # Prevent path traversal attacks
-        if not str(file_path).startswith(str(frontend_resolved)):
-            raise HTTPException(status_code=403, detail="Access denied")
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(file_path)
-    except (ValueError, OSError):
-        pass  # Invalid path
-    raise HTTPException(status_code=404, detail=f"File not found: {filename}")
-
-
-# Mount static files if directory exists
+# Mount static files if directory exists. The root mount serves the frontend
+# pages (index.html on "/") and must stay last so the /api routes match first.
 if FRONTEND_DIR.exists():
     app.mount("/static", StaticFiles(directory=FRONTEND_DIR), name="static")
+    app.mount("/", StaticFiles(directory=FRONTEND_DIR, html=True), name="root")
 
 
 # Allow overriding CSV path
@@ -6,16 +6,45 @@ Test Neo4j queries using the CORRECT schema:
 - Properties: type (not item_type)
 """
 
+import asyncio
+import csv
 import os
+import time
 
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase, GraphDatabase
 from neo4j.exceptions import CypherSyntaxError, ClientError
 
+# Indexes the queries below rely on. Names match LineageDataLoader.setup_schema
+# so running both is idempotent; FabricItem.id is already backed by the
+# item_id uniqueness constraint.
+SCHEMA_INDEXES = [
+    "CREATE INDEX workspace_name IF NOT EXISTS FOR (w:Workspace) ON (w.name)",
+    "CREATE INDEX item_name IF NOT EXISTS FOR (i:FabricItem) ON (i.name)",
+    "CREATE INDEX item_type IF NOT EXISTS FOR (i:FabricItem) ON (i.type)",
+    "CREATE INDEX item_degree IF NOT EXISTS FOR (i:FabricItem) ON (i.degree)",
+    "CREATE INDEX source_type IF NOT EXISTS FOR (s:ExternalSource) ON (s.type)",
+    "CREATE INDEX source_display_name IF NOT EXISTS FOR (s:ExternalSource) ON (s.display_name)",
+    "CREATE INDEX metric_name IF NOT EXISTS FOR (m:Metric) ON (m.name)",
+    "CREATE INDEX workspace_metrics_density IF NOT EXISTS FOR (m:WorkspaceMetrics) ON (m.density)",
+    "CREATE INDEX type_stats_type IF NOT EXISTS FOR (s:TypeStats) ON (s.type)",
+]
+
+# Same statement as LineageDataLoader.UPDATE_ITEM_DEGREES. The hub and degree
+# centrality queries read these properties, so a graph loaded before degrees
+# were stored (or edited by another writer) needs them recomputed first.
+UPDATE_ITEM_DEGREES = """
+    MATCH (i:FabricItem)
+    WITH i, COUNT { (i)<--() } AS in_degree, COUNT { (i)-->() } AS out_degree
+    SET i.in_degree = in_degree,
+        i.out_degree = out_degree,
+        i.degree = in_degree + out_degree
+"""
+
 # Corrected queries matching actual schema
 QUERIES = {
     # === DATABASE OVERVIEW ===
     "Quick Schema Overview - Node counts": """
-        MATCH (n)
+        MATCH (n) WHERE NOT n:MaterializedView
         RETURN labels(n)[0] AS label, count(*) AS count
         ORDER BY count DESC
     """,
@@ -28,34 +57,27 @@ QUERIES = {
     
     # === BASIC STATISTICS ===
     "Total Graph Metrics": """
-        MATCH (n)
-        WITH count(n) AS total_nodes
-        MATCH ()-[r]->()
-        WITH total_nodes, count(r) AS total_relationships
-        MATCH (w:Workspace)
-        WITH total_nodes, total_relationships, count(w) AS workspaces
-        MATCH (i:FabricItem)
-        WITH total_nodes, total_relationships, workspaces, count(i) AS items
-        MATCH (s:ExternalSource)
-        WITH total_nodes, total_relationships, workspaces, items, count(s) AS external_sources
-        MATCH (t:Table)
-        RETURN total_nodes, total_relationships, workspaces, items, external_sources, count(t) AS tables
+        CALL { MATCH (n) WHERE NOT n:MaterializedView RETURN count(n) AS total_nodes }
+        CALL { MATCH ()-[r]->() RETURN count(r) AS total_relationships }
+        CALL { MATCH (w:Workspace) RETURN count(w) AS workspaces }
+        CALL { MATCH (i:FabricItem) RETURN count(i) AS items }
+        CALL { MATCH (s:ExternalSource) RETURN count(s) AS external_sources }
+        CALL { MATCH (t:Table) RETURN count(t) AS tables }
+        RETURN total_nodes, total_relationships, workspaces, items, external_sources, tables
     """,
     
     "Node Distribution": """
-        MATCH (n)
+        MATCH (n) WHERE NOT n:MaterializedView
         WITH labels(n)[0] AS node_type, count(*) AS count
         RETURN node_type, count
         ORDER BY count DESC
     """,
     
     "Connectivity Statistics": """
-        MATCH (n)
-        WITH labels(n)[0] AS node_type, n
-        OPTIONAL MATCH (n)-[r]-()
-        WITH node_type, n, count(r) AS connections
+        MATCH (n) WHERE NOT n:MaterializedView
+        WITH labels(n)[0] AS node_type, COUNT { (n)--() } AS connections
         RETURN node_type, 
-               count(n) AS node_count,
+               count(*) AS node_count,
                avg(connections) AS avg_connections,
                min(connections) AS min_connections,
                max(connections) AS max_connections
@@ -65,17 +87,17 @@ QUERIES = {
     # === WORKSPACE ANALYSIS ===
     "Workspace Summary": """
         MATCH (w:Workspace)
-        OPTIONAL MATCH (w)-[:CONTAINS]->(i:FabricItem)
-        WITH w, count(i) AS item_count
-        OPTIONAL MATCH (w)-[:CONTAINS]->(i:FabricItem)-[:DEPENDS_ON]->()
-        WITH w, item_count, count(DISTINCT i) AS items_with_dependencies
+        WITH w, [(w)-[:CONTAINS]->(i:FabricItem) | i] AS items
+        WITH w,
+             size(items) AS item_count,
+             size([i IN items WHERE EXISTS { (i)-[:DEPENDS_ON]->() }]) AS items_with_dependencies
         RETURN w.name AS workspace, 
                w.id AS workspace_id,
                item_count,
                items_with_dependencies,
                item_count - items_with_dependencies AS standalone_items
         ORDER BY item_count DESC
-        LIMIT 20
+        LIMIT $limit
     """,
     
     "Workspace Item Type Distribution": """
@@ -84,7 +106,7 @@ QUERIES = {
                i.type AS item_type, 
                count(*) AS count
         ORDER BY w.name, count DESC
-        LIMIT 50
+        LIMIT $limit
     """,
     
     "Top Workspaces by Complexity": """
@@ -96,7 +118,7 @@ QUERIES = {
                total_relationships,
                round(1.0 * total_relationships / items, 2) AS avg_relationships_per_item
         ORDER BY total_relationships DESC
-        LIMIT 20
+        LIMIT $limit
     """,
     
     "Isolated Workspaces": """
@@ -111,7 +133,7 @@ QUERIES = {
         WITH w, count(i) AS item_count
         RETURN w.name AS isolated_workspace, item_count
         ORDER BY item_count DESC
-        LIMIT 20
+        LIMIT $limit
     """,
     
     # === ITEM ANALYSIS ===
@@ -123,16 +145,14 @@ QUERIES = {
     
     "Most Connected Items (Hub Nodes)": """
         MATCH (i:FabricItem)
-        OPTIONAL MATCH (i)-[out]->()
-        OPTIONAL MATCH (i)<-[in]-()
-        WITH i, count(DISTINCT out) AS outgoing, count(DISTINCT in) AS incoming
+        WHERE i.degree IS NOT NULL
         RETURN i.name AS item_name,
                i.type AS item_type,
-               incoming,
-               outgoing,
-               incoming + outgoing AS total_connections
-        ORDER BY total_connections DESC
-        LIMIT 25
+               i.in_degree AS incoming,
+               i.out_degree AS outgoing,
+               i.degree AS total_connections
+        ORDER BY i.degree DESC
+        LIMIT $limit
     """,
     
     "Leaf Nodes (No Downstream Consumers)": """
@@ -143,7 +163,7 @@ QUERIES = {
                i.type AS item_type,
                w.name AS workspace
         ORDER BY i.type, i.name
-        LIMIT 30
+        LIMIT $limit
     """,
     
     "Root Nodes (No Upstream Dependencies)": """
@@ -155,7 +175,7 @@ QUERIES = {
                i.type AS item_type,
                w.name AS workspace
         ORDER BY i.type, i.name
-        LIMIT 30
+        LIMIT $limit
     """,
     
     # === EXTERNAL SOURCE ANALYSIS ===
@@ -166,7 +186,7 @@ QUERIES = {
                s.type AS source_type,
                count(DISTINCT i) AS used_by_items
         ORDER BY used_by_items DESC
-        LIMIT 30
+        LIMIT $limit
     """,
     
     "External Source Types Distribution": """
@@ -183,7 +203,7 @@ QUERIES = {
                consumer_count,
                consumers[0..5] AS sample_consumers
         ORDER BY consumer_count DESC
-        LIMIT 20
+        LIMIT $limit
     """,
     
     "Unused External Sources": """
@@ -192,7 +212,7 @@ QUERIES = {
         RETURN s.display_name AS unused_source,
                s.type AS source_type
         ORDER BY s.type, s.display_name
-        LIMIT 30
+        LIMIT $limit
     """,
     
     "External Sources by Workspace": """
@@ -202,17 +222,19 @@ QUERIES = {
                count(DISTINCT s) AS source_count,
                collect(DISTINCT s.display_name)[0..3] AS sample_sources
         ORDER BY w.name, source_count DESC
-        LIMIT 50
+        LIMIT $limit
     """,
     
     # === DEPENDENCY & LINEAGE ===
     "Dependency Chain Analysis": """
-        MATCH path = (leaf:FabricItem)-[:DEPENDS_ON*]->(root)
+        MATCH (leaf:FabricItem)
         WHERE NOT EXISTS { MATCH (leaf)<-[:DEPENDS_ON]-() }
-        AND NOT EXISTS { MATCH (root)-[:DEPENDS_ON]->() }
+        AND EXISTS { MATCH (leaf)-[:DEPENDS_ON]->() }
+        MATCH path = (leaf)-[:DEPENDS_ON*..15]->(root)
+        WHERE NOT EXISTS { MATCH (root)-[:DEPENDS_ON]->() }
         WITH path, length(path) AS chain_length
         ORDER BY chain_length DESC
-        LIMIT 10
+        LIMIT $limit
         RETURN [n IN nodes(path) | n.name] AS chain, chain_length
     """,
     
@@ -227,7 +249,7 @@ QUERIES = {
                downstream_count,
                upstream_count * downstream_count AS impact_score
         ORDER BY impact_score DESC
-        LIMIT 20
+        LIMIT $limit
     """,
     
     # === CROSS-WORKSPACE ANALYSIS ===
@@ -241,7 +263,7 @@ QUERIES = {
                i2.name AS target_item,
                w2.name AS target_workspace
         ORDER BY w1.name, w2.name
-        LIMIT 30
+        LIMIT $limit
     """,
     
     "Workspace Dependency Matrix": """
@@ -253,7 +275,7 @@ QUERIES = {
                w2.name AS to_workspace,
                count(*) AS dependency_count
         ORDER BY dependency_count DESC
-        LIMIT 30
+        LIMIT $limit
     """,
     
     "Workspace Clusters": """
@@ -262,12 +284,12 @@ QUERIES = {
         MATCH (i2)<-[:CONTAINS]-(w2:Workspace)
         WHERE w1 <> w2
         WITH w1, w2, count(*) AS connections
-        WHERE connections >= 3
+        WHERE connections >= $min_connections
         RETURN w1.name AS workspace_a,
                w2.name AS workspace_b,
                connections
         ORDER BY connections DESC
-        LIMIT 20
+        LIMIT $limit
     """,
     
     "Cross-Workspace Data Flow Summary": """
@@ -279,7 +301,7 @@ QUERIES = {
                flow_count,
                sample_flows
         ORDER BY flow_count DESC
-        LIMIT 20
+        LIMIT $limit
     """,
     
     # === DATA QUALITY & GOVERNANCE ===
@@ -293,15 +315,19 @@ QUERIES = {
                i.type AS item_type,
                w.name AS workspace
         ORDER BY w.name, i.type
-        LIMIT 30
+        LIMIT $limit
     """,
     
     "Circular Dependencies": """
-        MATCH path = (i:FabricItem)-[:DEPENDS_ON*2..10]->(i)
+        MATCH (i:FabricItem)
+        WHERE EXISTS { MATCH (i)-[:DEPENDS_ON]->() }
+        AND EXISTS { MATCH (i)<-[:DEPENDS_ON]-() }
+        MATCH path = (i)-[:DEPENDS_ON*2..10]->(i)
+        WHERE all(n IN nodes(path) WHERE i.id <= n.id)
         RETURN DISTINCT [n IN nodes(path) | n.name] AS circular_path,
                length(path) AS cycle_length
         ORDER BY cycle_length
-        LIMIT 20
+        LIMIT $limit
     """,
     
     "Items Missing Workspace Assignment": """
@@ -310,13 +336,17 @@ QUERIES = {
         RETURN i.name AS unassigned_item,
                i.type AS item_type,
                i.id AS item_id
-        LIMIT 30
+        LIMIT $limit
     """,
     
     "Duplicate Detection": """
-        MATCH (i1:FabricItem), (i2:FabricItem)
-        WHERE i1.id < i2.id 
-        AND toLower(i1.name) = toLower(i2.name)
+        MATCH (i:FabricItem)
+        WITH coalesce(i.name_lower, toLower(i.name)) AS name_key, collect(i) AS items
+        WHERE size(items) > 1
+        UNWIND items AS i1
+        UNWIND items AS i2
+        WITH i1, i2
+        WHERE i1.id < i2.id
         OPTIONAL MATCH (i1)<-[:CONTAINS]-(w1:Workspace)
         OPTIONAL MATCH (i2)<-[:CONTAINS]-(w2:Workspace)
         RETURN i1.name AS item_name,
@@ -324,19 +354,18 @@ QUERIES = {
                w2.name AS workspace_2,
                i1.type AS type_1,
                i2.type AS type_2
-        LIMIT 30
+        LIMIT $limit
     """,
     
     # === PERFORMANCE & OPTIMIZATION ===
     "Degree Centrality (Most Connected Nodes)": """
         MATCH (i:FabricItem)
-        OPTIONAL MATCH (i)-[r]-()
-        WITH i, count(r) AS degree
+        WHERE i.degree IS NOT NULL
         RETURN i.name AS item_name,
                i.type AS item_type,
-               degree
-        ORDER BY degree DESC
-        LIMIT 30
+               i.degree AS degree
+        ORDER BY i.degree DESC
+        LIMIT $limit
     """,
     
     "Betweenness Analysis (Approximate)": """
@@ -355,7 +384,7 @@ QUERIES = {
                out_degree,
                in_degree * out_degree AS bridge_score
         ORDER BY bridge_score DESC
-        LIMIT 20
+        LIMIT $limit
     """,
     
     "Graph Density by Workspace": """
@@ -369,7 +398,7 @@ QUERIES = {
                edges,
                CASE WHEN n > 1 THEN round(2.0 * edges / (n * (n - 1)), 4) ELSE 0 END AS density
         ORDER BY density DESC
-        LIMIT 20
+        LIMIT $limit
     """,
     
     # === ADVANCED ANALYTICS ===
@@ -379,23 +408,23 @@ QUERIES = {
                i2.type AS target_type,
                count(*) AS occurrence_count
         ORDER BY occurrence_count DESC
-        LIMIT 30
+        LIMIT $limit
     """,
     
     "Workspace Maturity Score": """
         MATCH (w:Workspace)-[:CONTAINS]->(i:FabricItem)
-        WITH w, count(i) AS item_count
-        OPTIONAL MATCH (w)-[:CONTAINS]->(i2:FabricItem)-[:DEPENDS_ON]->()
-        WITH w, item_count, count(DISTINCT i2) AS items_with_deps
-        OPTIONAL MATCH (w)-[:CONTAINS]->(i3:FabricItem)-[:CONSUMES]->(:ExternalSource)
-        WITH w, item_count, items_with_deps, count(DISTINCT i3) AS items_with_sources
+        WITH w, collect(i) AS items
+        WITH w,
+             size(items) AS item_count,
+             size([i IN items WHERE EXISTS { (i)-[:DEPENDS_ON]->() }]) AS items_with_deps,
+             size([i IN items WHERE EXISTS { (i)-[:CONSUMES]->(:ExternalSource) }]) AS items_with_sources
         RETURN w.name AS workspace,
                item_count,
                items_with_deps,
                items_with_sources,
                round(100.0 * (items_with_deps + items_with_sources) / (2 * item_count), 1) AS maturity_score
         ORDER BY maturity_score DESC
-        LIMIT 20
+        LIMIT $limit
     """,
     
     # === UTILITY QUERIES ===
@@ -410,7 +439,7 @@ QUERIES = {
                t.schema AS schema,
                count(*) AS table_count
         ORDER BY table_count DESC
-        LIMIT 20
+        LIMIT $limit
     """,
     
     "Tables by Item (via MIRRORS)": """
@@ -420,7 +449,33 @@ QUERIES = {
                count(t) AS table_count,
                collect(t.name)[0..5] AS sample_tables
         ORDER BY table_count DESC
-        LIMIT 20
+        LIMIT $limit
+    """,
+    
+    # === MATERIALIZED VIEWS (refresh with --build-views) ===
+    "Materialized Workspace Metrics": """
+        MATCH (m:WorkspaceMetrics)
+        RETURN m.workspace AS workspace,
+               m.nodes AS nodes,
+               m.edges AS edges,
+               m.density AS density,
+               m.avg_degree AS avg_degree
+        ORDER BY m.density DESC
+        LIMIT $limit
+    """,
+    
+    "Materialized Type Statistics": """
+        MATCH (s:TypeStats)
+        RETURN s.type AS item_type, s.count AS count
+        ORDER BY s.count DESC
+    """,
+    
+    "Materialized Metrics": """
+        MATCH (m:Metric)
+        RETURN m.name AS metric,
+               m.row_count AS row_count,
+               datetime({epochMillis: m.updated_at}) AS refreshed_at
+        ORDER BY m.name
     """,
     
     "Items Consuming External Sources": """
@@ -430,16 +485,295 @@ QUERIES = {
                collect(s.display_name) AS sources,
                count(s) AS source_count
         ORDER BY source_count DESC
-        LIMIT 20
+        LIMIT $limit
     """,
 }
 
+# Records pulled per Bolt PULL request. Every query returns primitive
+# properties rather than nodes, so larger batches just mean fewer roundtrips.
+FETCH_SIZE = 10000
 
-def run_tests():
-    driver = GraphDatabase.driver(
+# Query parameters. Keeping literals out of the Cypher text lets Neo4j reuse
+# the cached plan for each query across runs.
+QUERY_PARAMS = {
+    "Workspace Summary": {"limit": 20},
+    "Workspace Item Type Distribution": {"limit": 50},
+    "Top Workspaces by Complexity": {"limit": 20},
+    "Isolated Workspaces": {"limit": 20},
+    "Most Connected Items (Hub Nodes)": {"limit": 25},
+    "Leaf Nodes (No Downstream Consumers)": {"limit": 30},
+    "Root Nodes (No Upstream Dependencies)": {"limit": 30},
+    "External Source Summary": {"limit": 30},
+    "Most Used External Sources": {"limit": 20},
+    "Unused External Sources": {"limit": 30},
+    "External Sources by Workspace": {"limit": 50},
+    "Dependency Chain Analysis": {"limit": 10},
+    "Single Points of Failure": {"limit": 20},
+    "Cross-Workspace Dependencies": {"limit": 30},
+    "Workspace Dependency Matrix": {"limit": 30},
+    "Workspace Clusters": {"limit": 20, "min_connections": 3},
+    "Cross-Workspace Data Flow Summary": {"limit": 20},
+    "Orphaned Items": {"limit": 30},
+    "Circular Dependencies": {"limit": 20},
+    "Items Missing Workspace Assignment": {"limit": 30},
+    "Duplicate Detection": {"limit": 30},
+    "Degree Centrality (Most Connected Nodes)": {"limit": 30},
+    "Betweenness Analysis (Approximate)": {"limit": 20},
+    "Graph Density by Workspace": {"limit": 20},
+    "Item Type Co-occurrence": {"limit": 30},
+    "Workspace Maturity Score": {"limit": 20},
+    "Table Statistics": {"limit": 20},
+    "Tables by Item (via MIRRORS)": {"limit": 20},
+    "Items Consuming External Sources": {"limit": 20},
+    "Materialized Workspace Metrics": {"limit": 20},
+}
+
+# Expensive analytics refreshed out-of-band by build_materialized_views().
+# Each query's rows are stored as JSON on a (:Metric {name}) node, so readers
+# pay for the traversal once per refresh instead of once per run. Every view
+# node also carries VIEW_LABEL, which whole-graph scans (MATCH (n)) exclude so
+# views are never counted as lineage nodes.
+VIEW_LABEL = "MaterializedView"
+
+MATERIALIZED_QUERIES = [
+    "Dependency Chain Analysis",
+    "Betweenness Analysis (Approximate)",
+    "Workspace Dependency Matrix",
+    "Graph Density by Workspace",
+]
+
+MATERIALIZE_METRIC = """
+    CALL apoc.cypher.run($query, $params) YIELD value
+    WITH collect(value) AS rows
+    MERGE (m:Metric {name: $name})
+    SET m:MaterializedView,
+        m.json = apoc.convert.toJson(rows),
+        m.row_count = size(rows),
+        m.updated_at = $refreshed_at
+"""
+
+# Item counts per type, shared by the type-distribution dashboards.
+MATERIALIZE_TYPE_STATS = """
+    MATCH (i:FabricItem)
+    WITH i.type AS item_type, count(*) AS item_count
+    WHERE item_type IS NOT NULL
+    MERGE (s:TypeStats {type: item_type})
+    SET s:MaterializedView,
+        s.count = item_count,
+        s.updated_at = $refreshed_at
+"""
+
+# Flattened per-workspace metrics, rebuilt in batches so the refresh does not
+# hold one long write transaction over the whole graph.
+MATERIALIZE_WORKSPACE_METRICS = """
+    CALL apoc.periodic.iterate(
+        "MATCH (w:Workspace) RETURN w",
+        "MATCH (w)-[:CONTAINS]->(i:FabricItem)
+         OPTIONAL MATCH (i)-[r:DEPENDS_ON]->(:FabricItem)<-[:CONTAINS]-(w)
+         WITH w, count(DISTINCT i) AS n, count(r) AS edges
+         MERGE (m:WorkspaceMetrics {workspace_id: w.id})
+         SET m:MaterializedView,
+             m.workspace = w.name,
+             m.nodes = n,
+             m.edges = edges,
+             m.density = CASE WHEN n > 1 THEN round(2.0 * edges / (n * (n - 1)), 4) ELSE 0 END,
+             m.avg_degree = round(2.0 * edges / n, 2),
+             m.updated_at = $refreshed_at",
+        {batchSize: 100, parallel: false, params: {refreshed_at: $refreshed_at}}
+    )
+    YIELD failedBatches, errorMessages
+    RETURN failedBatches, errorMessages
+"""
+
+
+def _connect(driver_class=GraphDatabase, **config):
+    return driver_class.driver(
         os.getenv("NEO4J_URI", "bolt://localhost:7687"),
-        auth=("neo4j", os.getenv("NEO4J_PASSWORD", "changeme_in_production"))
+        auth=("neo4j", os.getenv("NEO4J_PASSWORD", "changeme_in_production")),
+        **config
     )
+
+
+def build_materialized_views():
+    """
+    Refresh the materialized analytics views.
+
+    Intended to run out-of-band (e.g. nightly). View nodes not touched by
+    this refresh are removed afterwards, so readers never see a half-empty
+    view while it is being rebuilt.
+    """
+    refreshed_at = int(time.time() * 1000)
+    driver = _connect()
+    
+    with driver.session(fetch_size=FETCH_SIZE) as session:
+        _ensure_indexes(session)
+        for name in MATERIALIZED_QUERIES:
+            session.run(
+                MATERIALIZE_METRIC,
+                name=name,
+                query=QUERIES[name],
+                params=QUERY_PARAMS.get(name, {}),
+                refreshed_at=refreshed_at,
+            ).consume()
+            print(f"✅ Materialized {name}")
+        
+        session.run(MATERIALIZE_TYPE_STATS, refreshed_at=refreshed_at).consume()
+        print("✅ Materialized TypeStats")
+        
+        summary = session.run(
+            MATERIALIZE_WORKSPACE_METRICS, refreshed_at=refreshed_at
+        ).single()
+        if summary["failedBatches"]:
+            print(f"❌ WorkspaceMetrics: {summary['errorMessages']}")
+        else:
+            print("✅ Materialized WorkspaceMetrics")
+        
+        for label in ("Metric", "TypeStats", "WorkspaceMetrics"):
+            session.run(
+                f"MATCH (m:{label}) WHERE m.updated_at < $refreshed_at DETACH DELETE m",
+                refreshed_at=refreshed_at,
+            ).consume()
+    
+    driver.close()
+
+
+def _counting(query: str) -> str:
+    """
+    Wrap a query so the server returns only its row count.
+
+    The test driver never looks at row contents, so aggregating server-side
+    sends a single row over Bolt instead of building a Record per row in
+    Python. SHOW commands cannot be used inside a subquery and run as-is.
+    """
+    if query.lstrip().upper().startswith("SHOW"):
+        return query
+    return f"CALL {{{query}}}\nRETURN count(*) AS row_count"
+
+
+def _describe_error(e: Exception) -> str:
+    """Short, single-line description of a query failure."""
+    if isinstance(e, CypherSyntaxError):
+        return f"Syntax: {e.message[:100]}"
+    if isinstance(e, ClientError):
+        return f"Client: {e.message[:100]}"
+    return f"{type(e).__name__}: {str(e)[:100]}"
+
+
+def _ensure_indexes(session):
+    """Create missing schema indexes and wait until they are online."""
+    for statement in SCHEMA_INDEXES:
+        try:
+            session.run(statement).consume()
+        except ClientError as e:
+            print(f"⚠️  Index setup skipped: {e.message[:100]}")
+    session.run("CALL db.awaitIndexes()").consume()
+    missing = session.run(
+        "RETURN EXISTS { MATCH (i:FabricItem) WHERE i.degree IS NULL } AS missing"
+    ).single()["missing"]
+    if missing:
+        print("⚠️  Some FabricItems have no stored degree; recomputing degrees")
+        refresh_degrees(session)
+
+
+def refresh_degrees(session):
+    """Recompute the stored in/out/total degree of every FabricItem."""
+    session.run(UPDATE_ITEM_DEGREES).consume()
+
+
+def _run_batch(tx, queries, outcomes):
+    """
+    Transaction function: run ``queries`` in order until one fails.
+
+    Outcomes are appended to ``outcomes`` as they complete; the failing
+    query is recorded and its error re-raised so the managed transaction is
+    rolled back (and retried by the driver if the error is transient).
+    """
+    outcomes.clear()
+    for name, query in queries:
+        started = time.perf_counter_ns()
+        try:
+            counting = _counting(query)
+            result = tx.run(counting, QUERY_PARAMS.get(name, {}))
+            if counting is query:
+                count = sum(1 for _ in result)
+            else:
+                count = result.single()["row_count"]
+            result.consume()
+        except Exception as e:
+            outcomes.append((name, None, time.perf_counter_ns() - started, e))
+            raise
+        outcomes.append((name, count, time.perf_counter_ns() - started, None))
+
+
+def _run_pass(session):
+    """
+    Run every query in QUERIES inside one managed read transaction.
+
+    A single transaction avoids one auto-commit BEGIN/COMMIT roundtrip per
+    query, and ``execute_read`` retries transient failures. A failing query
+    invalidates the transaction, so the remaining queries continue in a
+    fresh one.
+
+    Returns:
+        List of (name, record_count, elapsed_ns, error) tuples in QUERIES order.
+    """
+    outcomes = []
+    pending = list(QUERIES.items())
+    while pending:
+        batch = []
+        try:
+            session.execute_read(_run_batch, pending, batch)
+        except Exception as e:
+            if len(batch) < len(pending) and (not batch or batch[-1][3] is None):
+                # Failed outside a query (e.g. connection loss); charge it to
+                # the next query so the pass still makes progress.
+                batch.append((pending[len(batch)][0], None, 0, e))
+        outcomes.extend(batch)
+        pending = pending[len(batch):]
+    return outcomes
+
+
+async def _run_pass_parallel(concurrency: int):
+    """
+    Run every query in QUERIES concurrently, each in its own session.
+
+    At most ``concurrency`` queries are in flight at once, drawing on a
+    connection pool of the same size.
+
+    Returns:
+        List of (name, record_count, elapsed_ns, error) tuples in QUERIES order.
+    """
+    driver = _connect(AsyncGraphDatabase, max_connection_pool_size=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run_one(name, query):
+        async with semaphore:
+            started = time.perf_counter_ns()
+            try:
+                async with driver.session(fetch_size=FETCH_SIZE) as session:
+                    counting = _counting(query)
+                    result = await session.run(counting, QUERY_PARAMS.get(name, {}))
+                    if counting is query:
+                        count = 0
+                        async for _ in result:
+                            count += 1
+                    else:
+                        count = (await result.single())["row_count"]
+                    await result.consume()
+                return name, count, time.perf_counter_ns() - started, None
+            except Exception as e:
+                return name, None, time.perf_counter_ns() - started, e
+    
+    try:
+        return list(await asyncio.gather(
+            *(run_one(name, query) for name, query in QUERIES.items())
+        ))
+    finally:
+        await driver.close()
+
+
+def run_tests(warmup: bool = True, concurrency: int = 1, cold: bool = False):
+    driver = _connect()
     
     print("=" * 80)
     print("Testing Neo4j Queries (Corrected Schema)")
@@ -452,42 +786,184 @@ def run_tests():
     failed = 0
     failed_queries = []
     
-    with driver.session() as session:
-        for name, query in QUERIES.items():
+    with driver.session(fetch_size=FETCH_SIZE) as session:
+        _ensure_indexes(session)
+        if cold:
+            # Opt-in: flushes the plan cache for the whole server, including
+            # other clients of a shared database.
             try:
-                result = session.run(query)
-                records = list(result)
-                print(f"✅ PASS ({len(records)} records) - {name}")
-                passed += 1
-            except CypherSyntaxError as e:
-                print(f"❌ FAIL: Syntax Error: {e.message[:100]} - {name}")
-                failed += 1
-                failed_queries.append((name, f"Syntax: {e.message[:100]}"))
-            except ClientError as e:
-                print(f"❌ FAIL: Client Error: {e.message[:100]} - {name}")
-                failed += 1
-                failed_queries.append((name, f"Client: {e.message[:100]}"))
-            except Exception as e:
-                print(f"❌ FAIL: {type(e).__name__}: {str(e)[:100]} - {name}")
-                failed += 1
-                failed_queries.append((name, f"{type(e).__name__}: {str(e)[:100]}"))
+                session.run("CALL db.clearQueryCaches()").consume()
+            except ClientError:
+                pass
+        if warmup and concurrency == 1:
+            # Compile every query once so the reported pass measures
+            # cached-plan execution.
+            _run_pass(session)
+        if concurrency == 1:
+            outcomes = _run_pass(session)
     
     driver.close()
     
-    print()
-    print("=" * 80)
-    print(f"SUMMARY: {passed} passed, {failed} failed out of {len(QUERIES)} queries")
-    print("=" * 80)
+    if concurrency > 1:
+        if warmup:
+            asyncio.run(_run_pass_parallel(concurrency))
+        outcomes = asyncio.run(_run_pass_parallel(concurrency))
+    
+    # Collect the report and write it once rather than one print per query.
+    lines = []
+    for name, count, elapsed_ns, error in outcomes:
+        if error is None:
+            lines.append(f"✅ PASS {elapsed_ns / 1e6:8.1f}ms ({count} records) - {name}")
+            passed += 1
+        else:
+            description = _describe_error(error)
+            lines.append(f"❌ FAIL {elapsed_ns / 1e6:8.1f}ms: {description} - {name}")
+            failed += 1
+            failed_queries.append((name, description))
+    
+    lines.append("")
+    lines.append("Slowest queries:")
+    slowest = sorted(outcomes, key=lambda outcome: outcome[2], reverse=True)[:10]
+    for name, _count, elapsed_ns, _error in slowest:
+        lines.append(f"  {elapsed_ns / 1e6:8.1f}ms  {name}")
+    
+    lines.append("")
+    lines.append("=" * 80)
+    lines.append(f"SUMMARY: {passed} passed, {failed} failed out of {len(QUERIES)} queries")
+    lines.append("=" * 80)
     
     if failed_queries:
-        print("\nFailed queries:")
+        lines.append("\nFailed queries:")
         for name, error in failed_queries:
-            print(f"  - {name}: {error}")
+            lines.append(f"  - {name}: {error}")
     
+    print("\n".join(lines))
     return failed == 0
 
 
+def _walk_plan(plan, depth=0):
+    """Yield (depth, operator) for every operator in a PROFILE plan tree."""
+    yield depth, plan
+    for child in plan.get("children", []):
+        yield from _walk_plan(child, depth + 1)
+
+
+def profile_queries(csv_path: str, budget_factor: float = 10.0):
+    """
+    PROFILE every query and write per-operator statistics to ``csv_path``.
+
+    Comparing the CSV across runs surfaces plan regressions, e.g. a label
+    scan replacing an index seek after a schema change. Queries whose total
+    db hits exceed ``budget_factor`` x the graph's node count are reported.
+
+    Returns:
+        List of (name, total_db_hits) for queries over budget.
+    """
+    driver = _connect()
+    over_budget = []
+    
+    with driver.session(fetch_size=FETCH_SIZE) as session:
+        node_count = session.run(
+            f"MATCH (n) WHERE NOT n:{VIEW_LABEL} RETURN count(n) AS c"
+        ).single()["c"]
+        budget = budget_factor * max(node_count, 1)
+        
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow([
+                "query", "depth", "operator", "db_hits", "rows",
+                "page_cache_hits", "page_cache_misses",
+            ])
+            for name, query in QUERIES.items():
+                if query.lstrip().upper().startswith("SHOW"):
+                    continue
+                try:
+                    summary = session.run(
+                        f"PROFILE {query}", QUERY_PARAMS.get(name, {})
+                    ).consume()
+                except Exception as e:
+                    print(f"❌ PROFILE failed: {_describe_error(e)} - {name}")
+                    continue
+                
+                total_db_hits = 0
+                for depth, operator in _walk_plan(summary.profile):
+                    db_hits = operator.get("dbHits", 0)
+                    total_db_hits += db_hits
+                    writer.writerow([
+                        name,
+                        depth,
+                        operator.get("operatorType"),
+                        db_hits,
+                        operator.get("rows", 0),
+                        operator.get("pageCacheHits", 0),
+                        operator.get("pageCacheMisses", 0),
+                    ])
+                if total_db_hits > budget:
+                    over_budget.append((name, total_db_hits))
+    
+    driver.close()
+    
+    print(f"Wrote query profiles to {csv_path}")
+    if over_budget:
+        print(f"\n⚠️  Queries over the db-hits budget ({budget:,.0f}):")
+        for name, total_db_hits in over_budget:
+            print(f"  - {name}: {total_db_hits:,} db hits")
+    return over_budget
+
+
 if __name__ == "__main__":
+    import argparse
     import sys
-    success = run_tests()
+    
+    parser = argparse.ArgumentParser(description="Test Neo4j lineage queries")
+    parser.add_argument(
+        "--build-views",
+        action="store_true",
+        help="Refresh the materialized analytics views and exit",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N queries concurrently (default: 1, one shared transaction)",
+    )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="Clear the server-wide query plan cache before the warm-up pass",
+    )
+    parser.add_argument(
+        "--refresh-degrees",
+        action="store_true",
+        help="Recompute the stored FabricItem degrees (e.g. after another writer changed edges) and exit",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="CSV",
+        help="PROFILE every query, write per-operator db hits to CSV and exit",
+    )
+    parser.add_argument(
+        "--db-hits-budget",
+        type=float,
+        default=10.0,
+        metavar="FACTOR",
+        help="With --profile, flag queries above FACTOR x node count db hits (default: 10)",
+    )
+    args = parser.parse_args()
+    
+    if args.build_views:
+        build_materialized_views()
+        sys.exit(0)
+    if args.refresh_degrees:
+        driver = _connect()
+        with driver.session() as session:
+            refresh_degrees(session)
+        driver.close()
+        print("✅ Refreshed item degrees")
+        sys.exit(0)
+    if args.profile:
+        over_budget = profile_queries(args.profile, args.db_hits_budget)
+        sys.exit(1 if over_budget else 0)
+    success = run_tests(concurrency=max(1, args.parallel), cold=args.cold)
     sys.exit(0 if success else 1)
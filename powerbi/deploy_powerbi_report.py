@@ -23,13 +23,17 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
+import time
 import requests
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
 
 # Try to import azure.identity for authentication
 try:
@@ -64,6 +68,32 @@ SCRIPT_DIR = Path(__file__).parent
 REPORT_LAYOUT_FILE = SCRIPT_DIR / "report_layout.json"
 MEASURES_FILE = SCRIPT_DIR / "measures" / "fabric_monitoring_measures.dax"
 
+# A measure starts at column 0 ("Measure Name = ...") and runs until a blank
+# line, a comment line or the end of the file; indented VAR/RETURN lines with
+# "=" stay part of the expression.
+MEASURE_PATTERN = re.compile(r"^(?!//)(\S[^=\n]*?)[ \t]*=[ \t]*(.*?)(?=\n[ \t]*\n|\n//|\Z)", re.M | re.S)
+
+# Refresh the bearer token this many seconds before it expires
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session with a pooled HTTPS adapter."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
+    return session
+
+
+@lru_cache(maxsize=8)
+def _parse_measures_file(path: str, mtime_ns: int) -> tuple:
+    """Parse (name, expression) pairs from a DAX file; cached until the file changes."""
+    with open(path, "r") as f:
+        content = f.read()
+    return tuple(
+        (match.group(1).strip(), match.group(2).strip())
+        for match in MEASURE_PATTERN.finditer(content)
+    )
+
 
 # =============================================================================
 # AUTHENTICATION
@@ -74,13 +104,24 @@ class PowerBIAuth:
     
     def __init__(self):
         self.token: Optional[str] = None
+        self.expires_on: float = 0
         self.credential = None
         
     def get_token(self) -> str:
-        """Get an access token for Power BI API."""
-        if self.token:
+        """Get an access token for Power BI API, reusing it until shortly before expiry."""
+        if self.token and time.time() < self.expires_on - TOKEN_REFRESH_MARGIN_SECONDS:
             return self.token
+        if self.credential is None:
+            self.credential = self._create_credential()
             
+        # Get token for Power BI scope
+        token = self.credential.get_token("https://analysis.windows.net/powerbi/api/.default")
+        self.token = token.token
+        self.expires_on = token.expires_on
+        return self.token
+        
+    def _create_credential(self):
+        """Create the Azure credential (Service Principal, else DefaultAzureCredential)."""
         # Try Service Principal first
         client_id = os.getenv("AZURE_CLIENT_ID")
         client_secret = os.getenv("AZURE_CLIENT_SECRET")
@@ -88,21 +129,15 @@ class PowerBIAuth:
         
         if client_id and client_secret and tenant_id and AZURE_IDENTITY_AVAILABLE:
             print("Authenticating with Service Principal...")
-            self.credential = ClientSecretCredential(
+            return ClientSecretCredential(
                 tenant_id=tenant_id,
                 client_id=client_id,
                 client_secret=client_secret
             )
-        elif AZURE_IDENTITY_AVAILABLE:
+        if AZURE_IDENTITY_AVAILABLE:
             print("Authenticating with DefaultAzureCredential...")
-            self.credential = DefaultAzureCredential()
-        else:
-            raise RuntimeError("No authentication method available")
-            
-        # Get token for Power BI scope
-        token = self.credential.get_token("https://analysis.windows.net/powerbi/api/.default")
-        self.token = token.token
-        return self.token
+            return DefaultAzureCredential()
+        raise RuntimeError("No authentication method available")
         
     def get_headers(self) -> Dict[str, str]:
         """Get HTTP headers with authorization."""
@@ -121,24 +156,28 @@ class PowerBIClient:
     
     def __init__(self, auth: PowerBIAuth):
         self.auth = auth
+        self.session = _create_session()
+        # Listing caches; call invalidate() after creating or deleting workspaces/datasets
+        self._workspaces_cache: Optional[List[Dict]] = None
+        self._datasets_cache: Dict[str, List[Dict]] = {}
+        
+    def invalidate(self, workspace_id: Optional[str] = None) -> None:
+        """Drop cached listings (all of them, or one workspace's datasets)."""
+        if workspace_id is None:
+            self._workspaces_cache = None
+            self._datasets_cache.clear()
+        else:
+            self._datasets_cache.pop(workspace_id, None)
         
     def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
         """Make an API request."""
-        url = f"{POWERBI_API_BASE}/{endpoint}"
+        url = endpoint if endpoint.startswith("https://") else f"{POWERBI_API_BASE}/{endpoint}"
         headers = self.auth.get_headers()
         
-        if method == "GET":
-            response = requests.get(url, headers=headers)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method == "PUT":
-            response = requests.put(url, headers=headers, json=data)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
-        elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data)
-        else:
+        if method not in ("GET", "POST", "PUT", "DELETE", "PATCH"):
             raise ValueError(f"Unsupported HTTP method: {method}")
+        body = data if method in ("POST", "PUT", "PATCH") else None
+        response = self.session.request(method, url, headers=headers, json=body)
             
         if response.status_code >= 400:
             print(f"API Error: {response.status_code}")
@@ -149,10 +188,20 @@ class PowerBIClient:
             return response.json()
         return {}
         
+    def _get_all(self, endpoint: str) -> List[Dict]:
+        """GET a collection, following @odata.nextLink pages."""
+        result = self._request("GET", endpoint)
+        values = result.get("value", [])
+        while result.get("@odata.nextLink"):
+            result = self._request("GET", result["@odata.nextLink"])
+            values.extend(result.get("value", []))
+        return values
+        
     def get_workspaces(self) -> List[Dict]:
-        """Get list of workspaces."""
-        result = self._request("GET", "groups")
-        return result.get("value", [])
+        """Get list of workspaces (cached per client)."""
+        if self._workspaces_cache is None:
+            self._workspaces_cache = self._get_all("groups")
+        return self._workspaces_cache
         
     def get_workspace_by_name(self, name: str) -> Optional[Dict]:
         """Get workspace by name."""
@@ -163,9 +212,10 @@ class PowerBIClient:
         return None
         
     def get_datasets_in_workspace(self, workspace_id: str) -> List[Dict]:
-        """Get datasets in a workspace."""
-        result = self._request("GET", f"groups/{workspace_id}/datasets")
-        return result.get("value", [])
+        """Get datasets in a workspace (cached per workspace)."""
+        if workspace_id not in self._datasets_cache:
+            self._datasets_cache[workspace_id] = self._get_all(f"groups/{workspace_id}/datasets")
+        return self._datasets_cache[workspace_id]
         
     def get_dataset_by_name(self, workspace_id: str, name: str) -> Optional[Dict]:
         """Get dataset by name."""
@@ -177,8 +227,7 @@ class PowerBIClient:
         
     def get_reports_in_workspace(self, workspace_id: str) -> List[Dict]:
         """Get reports in a workspace."""
-        result = self._request("GET", f"groups/{workspace_id}/reports")
-        return result.get("value", [])
+        return self._get_all(f"groups/{workspace_id}/reports")
         
     def create_report(self, workspace_id: str, report_name: str, dataset_id: str) -> Dict:
         """Create a new report bound to a dataset."""
@@ -221,7 +270,6 @@ class PowerBIClient:
                             f"groups/{workspace_id}/datasets/{dataset_id}/tables/{table_name}/measures",
                             data)
 
-
 # =============================================================================
 # FABRIC API CLIENT (for semantic model operations)
 # =============================================================================
@@ -231,22 +279,17 @@ class FabricClient:
     
     def __init__(self, auth: PowerBIAuth):
         self.auth = auth
+        self.session = _create_session()
         
     def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
         """Make an API request to Fabric API."""
-        url = f"{FABRIC_API_BASE}/{endpoint}"
+        url = endpoint if endpoint.startswith("https://") else f"{FABRIC_API_BASE}/{endpoint}"
         headers = self.auth.get_headers()
         
-        if method == "GET":
-            response = requests.get(url, headers=headers)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
-        else:
+        if method not in ("GET", "POST", "PATCH", "DELETE"):
             raise ValueError(f"Unsupported HTTP method: {method}")
+        body = data if method in ("POST", "PATCH") else None
+        response = self.session.request(method, url, headers=headers, json=body)
             
         if response.status_code >= 400:
             print(f"Fabric API Error: {response.status_code}")
@@ -257,18 +300,25 @@ class FabricClient:
             return response.json()
         return {}
         
+    def _get_all(self, endpoint: str) -> List[Dict]:
+        """GET a collection, following continuationUri pages."""
+        result = self._request("GET", endpoint)
+        values = result.get("value", [])
+        while result.get("continuationUri"):
+            result = self._request("GET", result["continuationUri"])
+            values.extend(result.get("value", []))
+        return values
+        
     def get_workspaces(self) -> List[Dict]:
         """Get list of Fabric workspaces."""
-        result = self._request("GET", "workspaces")
-        return result.get("value", [])
+        return self._get_all("workspaces")
         
     def get_items_in_workspace(self, workspace_id: str, item_type: Optional[str] = None) -> List[Dict]:
         """Get items in a workspace, optionally filtered by type."""
         endpoint = f"workspaces/{workspace_id}/items"
         if item_type:
             endpoint += f"?type={item_type}"
-        result = self._request("GET", endpoint)
-        return result.get("value", [])
+        return self._get_all(endpoint)
         
     def create_report(self, workspace_id: str, report_name: str, 
                       definition: Optional[Dict] = None) -> Dict:
@@ -302,62 +352,10 @@ class ReportBuilder:
         
     def _load_measures(self) -> List[Dict]:
         """Parse DAX measures from file."""
-        measures = []
         if not MEASURES_FILE.exists():
-            return measures
-            
-        with open(MEASURES_FILE, "r") as f:
-            content = f.read()
-            
-        # Simple parser for DAX measures
-        # Format: // Comment\nMeasure Name = \nDAX Expression
-        lines = content.split("\n")
-        current_measure = None
-        current_expression = []
-        
-        for line in lines:
-            # Skip section comments
-            if line.startswith("// ===") or line.startswith("// SECTION"):
-                continue
-            # Skip regular comments
-            if line.startswith("//"):
-                continue
-            # Check for measure definition start
-            if "=" in line and not line.strip().startswith("//"):
-                if current_measure:
-                    # Save previous measure
-                    measures.append({
-                        "name": current_measure,
-                        "expression": "\n".join(current_expression).strip()
-                    })
-                # Start new measure
-                parts = line.split("=", 1)
-                current_measure = parts[0].strip()
-                if len(parts) > 1:
-                    current_expression = [parts[1].strip()]
-                else:
-                    current_expression = []
-            elif current_measure:
-                # Continue expression
-                if line.strip():
-                    current_expression.append(line)
-                elif current_expression:
-                    # Empty line ends the measure
-                    measures.append({
-                        "name": current_measure,
-                        "expression": "\n".join(current_expression).strip()
-                    })
-                    current_measure = None
-                    current_expression = []
-                    
-        # Don't forget the last measure
-        if current_measure:
-            measures.append({
-                "name": current_measure,
-                "expression": "\n".join(current_expression).strip()
-            })
-            
-        return measures
+            return []
+        measures = _parse_measures_file(str(MEASURES_FILE), MEASURES_FILE.stat().st_mtime_ns)
+        return [{"name": name, "expression": expression} for name, expression in measures]
         
     def get_report_config(self) -> Dict:
         """Get full report configuration."""
@@ -26,18 +26,17 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Analysis window limits, read once after .env is loaded
+_MAX_DAYS = int(os.getenv("MAX_HISTORICAL_DAYS", "28"))
+_DEFAULT_DAYS = int(os.getenv("DEFAULT_ANALYSIS_DAYS", "7"))
+
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parents[2]))
 
-from usf_fabric_monitoring.core.pipeline import MonitorHubPipeline  # noqa: E402
-
 
 def main():
     """Main function for command line execution"""
-    max_days = int(os.getenv("MAX_HISTORICAL_DAYS", "28"))
-    default_days = int(os.getenv("DEFAULT_ANALYSIS_DAYS", "7"))
-
     parser = argparse.ArgumentParser(
         description="Microsoft Fabric Monitor Hub Analysis Pipeline",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -54,7 +53,7 @@ Examples:
         "--days",
         type=int,
         default=None,
-        help=f"Number of days of historical data to analyze (default: from env, max: {max_days} due to API limits)",
+        help=f"Number of days of historical data to analyze (default: from env, max: {_MAX_DAYS} due to API limits)",
     )
 
     parser.add_argument(
@@ -72,11 +71,11 @@ Examples:
 
     args = parser.parse_args()
 
-    effective_days = args.days if args.days is not None else default_days
+    effective_days = args.days if args.days is not None else _DEFAULT_DAYS
 
     # Print banner immediately
     print("🚀 Starting Microsoft Fabric Monitor Hub Analysis Pipeline", flush=True)
-    print(f"   • Analysis Period: {effective_days} days (max {max_days})", flush=True)
+    print(f"   • Analysis Period: {effective_days} days (max {_MAX_DAYS})", flush=True)
     print(f"   • Output Directory: {args.output_dir}", flush=True)
     print(
         f"   • Monitoring Scope: {'Member workspaces only' if args.member_only else 'All tenant workspaces'}",
@@ -87,6 +86,11 @@ Examples:
         flush=True,
     )
 
+    # Imported here so --help and argument errors return without loading
+    # the pipeline's dependency tree (pandas, Azure SDK, ...).
+    # Diagnose with: python -X importtime monitor_hub_pipeline.py --help
+    from usf_fabric_monitoring.core.pipeline import MonitorHubPipeline
+
     # Initialize and run pipeline
     pipeline = MonitorHubPipeline(args.output_dir)
 
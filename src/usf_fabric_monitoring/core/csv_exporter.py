@@ -49,6 +49,13 @@ class CSVExporter:
             # Export to CSV
             df_clean.to_csv(file_path, index=False, encoding="utf-8")
 
+            # Columnar copy for the analysis loader; the CSV stays the
+            # human-readable export, so a failed Parquet write is not fatal.
+            try:
+                df_clean.to_parquet(file_path.with_suffix(".parquet"), index=False)
+            except Exception as e:
+                self.logger.warning(f"Failed to write Parquet copy of {file_path.name}: {str(e)}")
+
             self.logger.info(
                 f"Exported {len(activities)} daily activities for {date.strftime('%Y-%m-%d')} to {file_path}"
             )
@@ -284,8 +291,10 @@ class CSVExporter:
 
         file_info = {"export_date": export_date.strftime("%Y-%m-%d"), "files": {}}
 
-        # Check for daily activities file
-        daily_file = self.daily_path / f"fabric_activities_{date_str}.csv"
+        # Check for daily activities file (Parquet copy or CSV)
+        daily_file = self.daily_path / f"fabric_activities_{date_str}.parquet"
+        if not daily_file.exists():
+            daily_file = daily_file.with_suffix(".csv")
         if daily_file.exists():
             file_info["files"]["daily_activities"] = {
                 "path": str(daily_file),
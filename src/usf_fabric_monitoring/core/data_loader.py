@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 import pandas as pd
+import pyarrow.parquet as pq
 
 RENAME_MAP = {
     "Id": "event_id",
@@ -31,6 +33,19 @@ RENAME_MAP = {
     "CompletionTime": "completion_time",
 }
 
+# Identifier columns (export names) are always loaded as strings: parsing them
+# from the CSV would turn "0012" into 12, so the CSV and Parquet copies of a
+# day would yield differently typed IDs.
+ID_COLUMNS = (
+    "Id",
+    "ActivityId",
+    "ItemId",
+    "WorkspaceId",
+    "_workspace_id",
+    "UserId",
+    "UserKey",
+)
+
 REQUIRED_COLUMNS = [
     "event_id",
     "activity_id",
@@ -54,20 +69,55 @@ REQUIRED_COLUMNS = [
 
 
 def load_activities_from_directory(export_dir: str) -> list[dict[str, object]]:
-    """Read all daily CSV exports within a directory and normalize column names."""
-    base_path = Path(export_dir)
-    daily_dir = base_path / "daily"
+    """Read all daily exports within a directory and normalize column names."""
+    activities: list[dict[str, object]] = []
+    for batch in load_activities_chunked(export_dir):
+        activities.extend(batch)
+    return activities
+
+
+def load_activities_chunked(export_dir: str, chunk_size: int = 100_000) -> Iterator[list[dict[str, object]]]:
+    """Yield normalized activity records from the daily exports in batches.
+
+    Each export is read ``chunk_size`` rows at a time, so only one chunk's DataFrame
+    is alive at once instead of every export plus their concatenation. A day's
+    Parquet copy is preferred over its CSV when both exist.
+    """
+    daily_dir = Path(export_dir) / "daily"
     if not daily_dir.exists():
-        return []
+        return
+
+    for export_path in _daily_export_paths(daily_dir):
+        if export_path.suffix == ".parquet":
+            batches = pq.ParquetFile(export_path).iter_batches(batch_size=chunk_size)
+            chunks = (_ids_as_strings(batch.to_pandas()) for batch in batches)
+        else:
+            chunks = pd.read_csv(export_path, chunksize=chunk_size, dtype=dict.fromkeys(ID_COLUMNS, str))
+        for chunk in chunks:
+            yield _normalize_activities(chunk).to_dict(orient="records")
 
-    frames = []
-    for csv_path in sorted(daily_dir.glob("fabric_activities_*.csv")):
-        frames.append(pd.read_csv(csv_path))
 
-    if not frames:
-        return []
+def _daily_export_paths(daily_dir: Path) -> list[Path]:
+    """One export file per day, sorted by name, preferring Parquet over CSV."""
+    paths = {path.stem: path for path in daily_dir.glob("fabric_activities_*.csv")}
+    paths.update({path.stem: path for path in daily_dir.glob("fabric_activities_*.parquet")})
+    return [paths[stem] for stem in sorted(paths)]
 
-    df = pd.concat(frames, ignore_index=True)
+
+def _ids_as_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast identifier columns stored with a non-string type to str, keeping nulls."""
+    for column in ID_COLUMNS:
+        if column not in df.columns or df[column].dtype == object:
+            continue
+        values = df[column]
+        if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+            values = values.astype("Int64")  # Integer IDs widened to float by nulls: 80.0 -> "80"
+        df[column] = values.astype(str).where(values.notna(), None)
+    return df
+
+
+def _normalize_activities(df: pd.DataFrame) -> pd.DataFrame:
+    """Rename export columns to analyzer fields and fill derived values."""
     df = _rename_columns(df)
     df = _ensure_required_columns(df)
 
@@ -81,7 +131,7 @@ def load_activities_from_directory(export_dir: str) -> list[dict[str, object]]:
     df["start_time"] = _coalesce_datetime(df, ["start_time", "creation_time"])
     df["end_time"] = _coalesce_datetime(df, ["end_time", "completion_time"])
 
-    return df.to_dict(orient="records")
+    return df
 
 
 def _rename_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -121,5 +171,5 @@ def _coalesce_datetime(df: pd.DataFrame, columns: list[str]) -> pd.Series:
         else:
             series = series.fillna(candidate)
     if series is None:
-        return pd.Series([None] * len(df))
+        return pd.Series([None] * len(df), index=df.index)
     return series
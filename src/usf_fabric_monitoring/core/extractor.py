@@ -11,6 +11,7 @@ This module handles data extraction from Microsoft Fabric APIs including:
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -55,7 +56,9 @@ class FabricDataExtractor:
             backoff_factor=int(os.getenv("RETRY_BACKOFF_FACTOR", "2")),
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Concurrent per-workspace requests (member-only extraction)
+        self.max_workers = max(1, int(os.getenv("EXTRACTION_MAX_WORKERS", "8")))
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=max(10, self.max_workers))
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -540,36 +543,64 @@ class FabricDataExtractor:
             target_workspaces = self.get_workspaces(tenant_wide=False, exclude_personal=True)
             self._workspace_lookup = {ws.get("id"): ws for ws in target_workspaces if ws.get("id")}
 
-            self.logger.info(f"Fetching activities for {len(target_workspaces)} member workspaces")
-
-            for workspace in target_workspaces:
-                workspace_id = workspace.get("id")
-                if not workspace_id:
-                    continue
+            self.logger.info(
+                f"Fetching activities for {len(target_workspaces)} member workspaces "
+                f"({self.max_workers} concurrent requests)"
+            )
 
-                try:
-                    activities = self.get_workspace_activities(
-                        workspace_id=workspace_id,
-                        start_date=start_date,
-                        end_date=end_date,
-                        activity_types=activity_types,
+            # Requests are I/O bound, so overlap them across a bounded pool;
+            # results are collected in workspace order.
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    (
+                        workspace.get("id"),
+                        executor.submit(
+                            self._get_enriched_workspace_activities,
+                            workspace,
+                            start_date,
+                            end_date,
+                            activity_types,
+                        ),
                     )
+                    for workspace in target_workspaces
+                    if workspace.get("id")
+                ]
 
-                    item_lookup = self._get_workspace_items_lookup(workspace_id)
-
-                    for activity in activities:
-                        enriched = self._enrich_activity(activity, workspace_id, workspace)
-                        if item_lookup:
-                            self._attach_item_metadata(enriched, workspace_id, item_lookup)
-                        all_activities.append(enriched)
-
-                except Exception as e:
-                    self.logger.warning(f"Failed to fetch activities for workspace {workspace_id}: {str(e)}")
-                    continue
+                for workspace_id, future in futures:
+                    try:
+                        all_activities.extend(future.result())
+                    except Exception as e:
+                        self.logger.warning(f"Failed to fetch activities for workspace {workspace_id}: {str(e)}")
 
             self.logger.info(f"Total activities retrieved for {date.strftime('%Y-%m-%d')}: {len(all_activities)}")
             return all_activities
 
+    def _get_enriched_workspace_activities(
+        self,
+        workspace: dict[str, Any],
+        start_date: datetime,
+        end_date: datetime,
+        activity_types: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch one workspace's activities and enrich them with workspace and item metadata."""
+        workspace_id = workspace["id"]
+        activities = self.get_workspace_activities(
+            workspace_id=workspace_id,
+            start_date=start_date,
+            end_date=end_date,
+            activity_types=activity_types,
+        )
+
+        item_lookup = self._get_workspace_items_lookup(workspace_id)
+
+        enriched_activities = []
+        for activity in activities:
+            enriched = self._enrich_activity(activity, workspace_id, workspace)
+            if item_lookup:
+                self._attach_item_metadata(enriched, workspace_id, item_lookup)
+            enriched_activities.append(enriched)
+        return enriched_activities
+
     def get_workspace_items(self, workspace_id: str) -> list[dict[str, Any]]:
         """
         Get all items (reports, datasets, etc.) in a workspace.
@@ -55,7 +55,9 @@ class HistoricalAnalysisEngine:
         """
         self.logger.info("Starting comprehensive historical analysis")
 
-        activities_df = pd.DataFrame(historical_data["activities"])
+        # Reuse the pipeline's DataFrame when present (copied: analysis adds columns)
+        frame = historical_data.get("_frame")
+        activities_df = pd.DataFrame(historical_data["activities"]) if frame is None else frame.copy()
 
         analysis_results = {
             "analysis_metadata": {
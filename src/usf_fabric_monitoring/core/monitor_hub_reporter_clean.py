@@ -20,6 +20,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from .historical_analyzer import HistoricalAnalysisEngine
@@ -64,7 +65,9 @@ class MonitorHubCSVReporter:
         report_files = {}
 
         # 1. Master Activities Report
-        activities_file = self._generate_activities_report(historical_data["activities"])
+        activities_file = self._generate_activities_report(
+            historical_data["activities"], historical_data.get("_frame"), historical_data.get("_failed_mask")
+        )
         report_files["activities_report"] = activities_file
 
         # 2. Key Measurables Summary
@@ -94,19 +97,29 @@ class MonitorHubCSVReporter:
         self.logger.info(f"Generated {len(report_files)} comprehensive reports")
         return report_files
 
-    def _generate_activities_report(self, activities: list[dict[str, Any]]) -> str:
-        """Generate master activities report with all activity details"""
+    def _generate_activities_report(
+        self,
+        activities: list[dict[str, Any]],
+        activities_frame: pd.DataFrame | None = None,
+        failed_mask: np.ndarray | None = None,
+    ) -> str:
+        """Generate master activities report with all activity details
+
+        ``activities_frame``/``failed_mask`` are the pipeline's precomputed DataFrame
+        of ``activities`` and its ``status == "Failed"`` mask, reused when given.
+        """
         if not activities:
             return self._create_empty_report("activities_master")
 
-        df = pd.DataFrame(activities)
+        df = pd.DataFrame(activities) if activities_frame is None else activities_frame.copy()
 
         # Add derived columns for analysis
-        df["date"] = pd.to_datetime(df["start_time"], format="mixed", errors="coerce", utc=True).dt.date
-        df["hour"] = pd.to_datetime(df["start_time"], format="mixed", errors="coerce", utc=True).dt.hour
+        start_times = pd.to_datetime(df["start_time"], format="mixed", errors="coerce", utc=True, cache=True)
+        df["date"] = start_times.dt.date
+        df["hour"] = start_times.dt.hour
         df["duration_minutes"] = df["duration_seconds"] / 60
-        df["is_failed"] = df["status"] == "Failed"
-        df["is_success"] = df["status"] != "Failed"
+        df["is_failed"] = df["status"] == "Failed" if failed_mask is None else failed_mask
+        df["is_success"] = ~df["is_failed"]
 
         # Reorder columns for better readability
         column_order = [
@@ -4,12 +4,19 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson  # Optional: several times faster than json for large job exports
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from usf_fabric_monitoring.core.csv_exporter import CSVExporter
 from usf_fabric_monitoring.core.data_loader import load_activities_from_directory
 from usf_fabric_monitoring.core.logger import setup_logging
 from usf_fabric_monitoring.core.monitor_hub_reporter_clean import MonitorHubCSVReporter
-from usf_fabric_monitoring.core.utils import resolve_path
+from usf_fabric_monitoring.core.utils import json_loads, resolve_path
 
 # Opt into the future pandas behaviour to suppress FutureWarning on fillna
 pd.set_option("future.no_silent_downcasting", True)
@@ -93,6 +100,14 @@ def _get_item_details_extraction():
     return _run_item_details_extraction
 
 
+# Analysis window limits (API maximum and default), read once at import
+_MAX_DAYS = int(os.getenv("MAX_HISTORICAL_DAYS", "28"))
+_DEFAULT_DAYS = int(os.getenv("DEFAULT_ANALYSIS_DAYS", "7"))
+
+# Activity columns counted in the summary's "analysis_scope" section
+_SUMMARY_SCOPE_COLUMNS = ["workspace_id", "submitted_by", "domain", "item_type"]
+
+
 class MonitorHubPipeline:
     """Complete Monitor Hub analysis pipeline"""
 
@@ -112,7 +127,7 @@ class MonitorHubPipeline:
         self.output_directory.mkdir(parents=True, exist_ok=True)
 
         self.reporter = None
-        self.max_days = int(os.getenv("MAX_HISTORICAL_DAYS", "28"))
+        self.max_days = _MAX_DAYS
 
         self.logger.info("Monitor Hub Pipeline initialized")
 
@@ -134,13 +149,21 @@ class MonitorHubPipeline:
             extraction_dir = self._prepare_extraction_directory()
 
             self.logger.info("Step 1: Extracting historical activities from Fabric APIs")
-            run_historical_extraction = _get_historical_extraction()
-            extraction_result = run_historical_extraction(
-                start_date=start_date,
-                end_date=end_date,
-                output_dir=str(extraction_dir),
-                tenant_wide=tenant_wide,
-            )
+            missing_days = self._missing_extraction_days(extraction_dir, start_date, end_date)
+            if missing_days:
+                # Days already exported are skipped by the extractor, so only the
+                # span covering the missing days needs to be requested.
+                self.logger.info(f"{len(missing_days)} of {resolved_days} days not yet extracted")
+                run_historical_extraction = _get_historical_extraction()
+                extraction_result = run_historical_extraction(
+                    start_date=missing_days[0],
+                    end_date=missing_days[-1],
+                    output_dir=str(extraction_dir),
+                    tenant_wide=tenant_wide,
+                )
+            else:
+                self.logger.info("✅ All days already extracted; skipping Fabric API extraction")
+                extraction_result = {"status": "success", "cached": True, "failed_days": []}
 
             if extraction_result.get("status") != "success":
                 message = extraction_result.get("message", "Historical extraction failed")
@@ -195,15 +218,21 @@ class MonitorHubPipeline:
             historical_data = self._build_historical_dataset(activities, start_date, end_date, resolved_days)
             self.logger.info(f"✅ Loaded {len(activities)} activities for analysis")
 
+            # Built once in _build_historical_dataset and shared by the Parquet
+            # export, the CSV reports and the summary.
+            activities_frame = historical_data["_frame"]
+
             self.logger.info("Step 2c: Persisting merged data to Parquet (Source of Truth)")
-            self._save_to_parquet(historical_data)
+            self._save_to_parquet(historical_data, activities_frame)
 
             self.logger.info("Step 3: Generating comprehensive CSV reports")
             self.reporter = MonitorHubCSVReporter(str(self.output_directory))
             report_files = self.reporter.generate_comprehensive_reports(historical_data)
             self.logger.info(f"✅ Generated {len(report_files)} comprehensive reports")
 
-            pipeline_summary = self._create_pipeline_summary(historical_data, report_files, resolved_days)
+            pipeline_summary = self._create_pipeline_summary(
+                historical_data, report_files, resolved_days, activities_frame
+            )
 
             return {
                 "status": "success",
@@ -221,7 +250,7 @@ class MonitorHubPipeline:
             self.logger.error(f"Pipeline failed: {str(e)}")
             return {"status": "error", "message": str(e), "report_files": {}}
 
-    def _save_to_parquet(self, historical_data: dict[str, Any]) -> None:
+    def _save_to_parquet(self, historical_data: dict[str, Any], activities_frame: pd.DataFrame | None = None) -> None:
         """
         Save merged data to Parquet files for Delta Table ingestion.
 
@@ -229,6 +258,7 @@ class MonitorHubPipeline:
 
         Args:
             historical_data: The dictionary containing merged activities, workspaces, and items.
+            activities_frame: Optional DataFrame of ``historical_data["activities"]`` (not modified).
         """
         parquet_dir = self.output_directory / "parquet"
         parquet_dir.mkdir(parents=True, exist_ok=True)
@@ -247,7 +277,7 @@ class MonitorHubPipeline:
         activities = historical_data.get("activities", [])
         if activities:
             try:
-                df_activities = pd.DataFrame(activities)
+                df_activities = pd.DataFrame(activities) if activities_frame is None else activities_frame.copy()
                 # Ensure datetime columns are properly typed for Parquet
                 for col in ["start_time", "end_time", "creation_time"]:
                     if col in df_activities.columns:
@@ -282,32 +312,38 @@ class MonitorHubPipeline:
                 self.logger.error(f"Failed to save items to parquet: {e}")
 
     def _create_pipeline_summary(
-        self, historical_data: dict[str, Any], report_files: dict[str, str], days: int
+        self,
+        historical_data: dict[str, Any],
+        report_files: dict[str, str],
+        days: int,
+        activities_frame: pd.DataFrame | None = None,
     ) -> dict[str, Any]:
         """Create summary of pipeline execution"""
 
-        # Calculate basic statistics
-        activities = historical_data.get("activities", [])
-        total_activities = len(activities)
-
-        if total_activities > 0:
-            failed_activities = sum(1 for a in activities if a.get("status") == "Failed")
-            success_rate = ((total_activities - failed_activities) / total_activities) * 100
-
-            # Calculate duration statistics
-            durations = [a.get("duration_seconds", 0) for a in activities]
-            total_duration_seconds = sum(durations)
-            total_duration_seconds / total_activities if total_activities > 0 else 0
+        # Calculate basic statistics: column reductions over the caller's
+        # DataFrame when given, otherwise one fused pass over the dicts.
+        if activities_frame is None:
+            (
+                total_activities,
+                failed_activities,
+                total_duration_seconds,
+                unique_counts,
+            ) = self._summarize_activity_records(historical_data.get("activities", []))
         else:
-            failed_activities = 0
-            success_rate = 0
-            total_duration_seconds = 0
+            df = activities_frame
+            total_activities = len(df)
+            failed_mask = historical_data.get("_failed_mask")
+            if failed_mask is None:
+                failed_mask = df["status"].eq("Failed").to_numpy() if "status" in df else np.zeros(len(df), dtype=bool)
+            failed_activities = int(failed_mask.sum())
+            total_duration_seconds = float(df["duration_seconds"].fillna(0).sum()) if "duration_seconds" in df else 0
+            # Unique counts ignore missing and empty values
+            unique_counts = {
+                column: int(df[column].replace("", None).nunique(dropna=True)) if column in df else 0
+                for column in _SUMMARY_SCOPE_COLUMNS
+            }
 
-        # Get unique counts
-        workspaces = {a.get("workspace_id") for a in activities if a.get("workspace_id")}
-        users = {a.get("submitted_by") for a in activities if a.get("submitted_by")}
-        domains = {a.get("domain") for a in activities if a.get("domain")}
-        item_types = {a.get("item_type") for a in activities if a.get("item_type")}
+        success_rate = ((total_activities - failed_activities) / total_activities) * 100 if total_activities else 0
 
         summary = {
             "pipeline_execution": {
@@ -322,27 +358,84 @@ class MonitorHubPipeline:
                 "total_duration_hours": round(total_duration_seconds / 3600, 2),
             },
             "analysis_scope": {
-                "unique_workspaces": len(workspaces),
-                "unique_users": len(users),
-                "unique_domains": len(domains),
-                "unique_item_types": len(item_types),
+                "unique_workspaces": unique_counts["workspace_id"],
+                "unique_users": unique_counts["submitted_by"],
+                "unique_domains": unique_counts["domain"],
+                "unique_item_types": unique_counts["item_type"],
             },
             "report_files": report_files,
         }
 
         # Save summary to file
         summary_file = self.output_directory / f"pipeline_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2, default=str)
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            summary_file.write_bytes(orjson.dumps(summary, default=str, option=option))
+        else:
+            with open(summary_file, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2, default=str)
 
         self.logger.info(f"Pipeline summary saved to: {summary_file}")
 
+        # One flat row of the numeric sections, for Power BI / Spark to read directly
+        summary_row = {**summary["pipeline_execution"], **summary["key_measurables"], **summary["analysis_scope"]}
+        try:
+            pd.DataFrame([summary_row]).to_parquet(summary_file.with_suffix(".parquet"), index=False)
+        except Exception as e:
+            self.logger.warning(f"Failed to save pipeline summary to parquet: {e}")
+
         return summary
 
+    @staticmethod
+    def _summarize_activity_records(
+        activities: list[dict[str, Any]],
+    ) -> tuple[int, int, float, dict[str, int]]:
+        """Failure count, total duration and unique scope counts in a single pass.
+
+        Returns:
+            Tuple of (total_activities, failed_activities, total_duration_seconds,
+            unique_counts keyed by scope column).
+        """
+        failed = 0
+        total_duration = 0.0
+        workspaces: set[Any] = set()
+        users: set[Any] = set()
+        domains: set[Any] = set()
+        item_types: set[Any] = set()
+        add_workspace, add_user, add_domain, add_item_type = (
+            workspaces.add,
+            users.add,
+            domains.add,
+            item_types.add,
+        )
+
+        for activity in activities:
+            get = activity.get
+            if get("status") == "Failed":
+                failed += 1
+            duration = get("duration_seconds")
+            if duration and duration == duration:  # skip None and NaN
+                total_duration += duration
+            add_workspace(get("workspace_id"))
+            add_user(get("submitted_by"))
+            add_domain(get("domain"))
+            add_item_type(get("item_type"))
+
+        def count_present(values: set[Any]) -> int:
+            # Discard missing (None/NaN) and empty values collected above
+            return sum(1 for value in values if value and value == value)
+
+        unique_counts = {
+            "workspace_id": count_present(workspaces),
+            "submitted_by": count_present(users),
+            "domain": count_present(domains),
+            "item_type": count_present(item_types),
+        }
+        return len(activities), failed, total_duration, unique_counts
+
     def _resolve_days(self, requested_days: int | None) -> int:
-        default_days = int(os.getenv("DEFAULT_ANALYSIS_DAYS", "7"))
         if not requested_days:
-            requested_days = default_days
+            requested_days = _DEFAULT_DAYS
         return min(max(1, requested_days), self.max_days)
 
     def _calculate_date_range(self, days: int) -> tuple[datetime, datetime]:
@@ -356,6 +449,19 @@ class MonitorHubPipeline:
         extraction_dir.mkdir(parents=True, exist_ok=True)
         return extraction_dir
 
+    def _missing_extraction_days(
+        self, extraction_dir: Path, start_date: datetime, end_date: datetime
+    ) -> list[datetime]:
+        """Return the days in ``[start_date, end_date]`` with no daily activity export yet."""
+        exporter = CSVExporter(export_base_path=str(extraction_dir))
+        missing_days = []
+        current_date = start_date
+        while current_date <= end_date:
+            if not exporter.get_export_file_info(current_date)["files"].get("daily_activities"):
+                missing_days.append(current_date)
+            current_date += timedelta(days=1)
+        return missing_days
+
     def _check_recent_job_details_extraction(self, details_output_dir: Path, hours_threshold: int = 8) -> bool:
         """Check if we have recent detailed job data within the threshold."""
         try:
@@ -407,9 +513,7 @@ class MonitorHubPipeline:
         for job_file in job_files:
             self.logger.info(f"Loading detailed jobs from {job_file}")
             try:
-                with open(job_file) as f:
-                    jobs = json.load(f)
-                    all_jobs.extend(jobs)
+                all_jobs.extend(json_loads(job_file.read_bytes()))
             except Exception as e:
                 self.logger.error(f"Failed to load detailed jobs from {job_file}: {e}")
 
@@ -584,28 +688,12 @@ class MonitorHubPipeline:
     def _build_historical_dataset(
         self, activities: list[dict[str, Any]], start_date: datetime, end_date: datetime, days: int
     ) -> dict[str, Any]:
-        workspace_lookup: dict[str, dict[str, Any]] = {}
-        item_lookup: dict[str, dict[str, Any]] = {}
-
         # Filter for Fabric-only activities
         fabric_activities = [a for a in activities if self._is_fabric_activity(a)]
         self.logger.info(f"Filtered {len(activities)} total activities to {len(fabric_activities)} Fabric activities")
 
-        for activity in fabric_activities:
-            workspace_id = activity.get("workspace_id")
-            if workspace_id and workspace_id not in workspace_lookup:
-                workspace_lookup[workspace_id] = {
-                    "id": workspace_id,
-                    "displayName": activity.get("workspace_name") or "Unknown",
-                }
-
-            item_id = activity.get("item_id")
-            if item_id and item_id not in item_lookup:
-                item_lookup[item_id] = {
-                    "id": item_id,
-                    "displayName": activity.get("item_name") or "Unknown",
-                    "type": activity.get("item_type") or "Unknown",
-                }
+        frame = pd.DataFrame(fabric_activities)
+        failed_mask = frame["status"].eq("Failed").to_numpy() if "status" in frame else np.zeros(len(frame), dtype=bool)
 
         return {
             "analysis_period": {
@@ -614,11 +702,35 @@ class MonitorHubPipeline:
                 "days": days,
                 "description": f"{days}-day analysis window",
             },
-            "workspaces": list(workspace_lookup.values()),
-            "items": list(item_lookup.values()),
+            "workspaces": self._first_seen_records(frame, "workspace_id", {"displayName": "workspace_name"}),
+            "items": self._first_seen_records(frame, "item_id", {"displayName": "item_name", "type": "item_type"}),
             "activities": fabric_activities,
+            # Shared with downstream consumers so they don't rebuild the frame
+            # or re-scan statuses; row-aligned with "activities".
+            "_frame": frame,
+            "_failed_mask": failed_mask,
         }
 
+    @staticmethod
+    def _first_seen_records(frame: pd.DataFrame, id_column: str, fields: dict[str, str]) -> list[dict[str, Any]]:
+        """
+        Return one ``{"id": ..., <field>: ...}`` record per distinct id, taken from its first row.
+
+        Rows with a missing or empty id are skipped; missing or empty field values become "Unknown".
+        """
+        if id_column not in frame.columns:
+            return []
+
+        subset = frame.reindex(columns=[id_column, *fields.values()])
+        subset = subset[subset[id_column].notna() & (subset[id_column] != "")]
+        subset = subset.drop_duplicates(id_column)
+
+        records = pd.DataFrame({"id": subset[id_column]})
+        for key, column in fields.items():
+            values = subset[column]
+            records[key] = values.where(values.notna() & (values != ""), "Unknown")
+        return records.to_dict("records")
+
     def _is_fabric_activity(self, activity: dict[str, Any]) -> bool:
         """Check if activity is related to a Fabric item type."""
         # If it comes from JobHistory, it is definitely a Fabric activity
@@ -1000,20 +1000,17 @@ class FactActivityBuilder(DimensionBuilder):
         records = []
         extracted_at = datetime.now(UTC)
 
-        for activity in activities:
-            # Parse timestamp for incremental filtering
-            start_time_str = activity.get("start_time")
-            if start_time_str:
-                try:
-                    start_time = pd.to_datetime(start_time_str, utc=True)
-
-                    # Skip if before high water mark (incremental load)
-                    if high_water_mark and start_time <= pd.to_datetime(high_water_mark, utc=True):
-                        continue
-                except Exception:
-                    start_time = None
-            else:
-                start_time = None
+        # Parse timestamps in one vectorized pass (cache=True reuses repeated values);
+        # unparseable or missing values become NaT.
+        start_times = self._parse_timestamps(activities, "start_time")
+        end_times = self._parse_timestamps(activities, "end_time")
+        high_water_mark = pd.to_datetime(high_water_mark, utc=True) if high_water_mark else None
+
+        for activity, start_time, end_time in zip(activities, start_times, end_times):
+            # Skip if before high water mark (incremental load)
+            start_time = None if pd.isna(start_time) else start_time
+            if start_time is not None and high_water_mark is not None and start_time <= high_water_mark:
+                continue
 
             # Calculate duration
             duration_seconds = float(activity.get("duration_seconds") or 0)
@@ -1028,16 +1025,9 @@ class FactActivityBuilder(DimensionBuilder):
 
             # Build date/time keys (handle NaT/None)
             # Use start_time if available, fallback to end_time (for job failures without start_time)
-            event_time = start_time
-            if not event_time or pd.isna(event_time):
-                end_time_str = activity.get("end_time")
-                if end_time_str:
-                    try:
-                        event_time = pd.to_datetime(end_time_str, utc=True)
-                    except Exception:
-                        event_time = None
-
-            if event_time and pd.notna(event_time):
+            event_time = start_time if start_time is not None else end_time
+
+            if event_time is not None and pd.notna(event_time):
                 date_sk = int(event_time.strftime("%Y%m%d"))
                 # Round to nearest 15 minutes for time_sk
                 hour = event_time.hour
@@ -1094,6 +1084,12 @@ class FactActivityBuilder(DimensionBuilder):
 
         return pd.DataFrame(records)
 
+    @staticmethod
+    def _parse_timestamps(activities: list[dict[str, Any]], key: str) -> pd.Series:
+        """Parse one timestamp field of every activity to UTC (NaT when missing or invalid)."""
+        values = pd.Series([activity.get(key) for activity in activities], dtype=object)
+        return pd.to_datetime(values, utc=True, errors="coerce", format="mixed", cache=True)
+
 
 # =============================================================================
 # AGGREGATE BUILDERS
@@ -1,5 +1,12 @@
+import json
 import os
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson  # Optional: several times faster than json for large exports
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from usf_fabric_monitoring.core.env_detection import is_fabric_environment  # noqa: F401
 
@@ -52,3 +59,18 @@ def resolve_path(relative_path: str) -> Path:
         Path: Absolute path rooted in Lakehouse if in Fabric, else project root.
     """
     return get_base_output_path() / relative_path
+
+
+def json_loads(raw: str | bytes) -> Any:
+    """
+    Parse JSON text or bytes, with orjson when installed.
+
+    orjson rejects the NaN/Infinity literals that json.dump writes for float
+    NaNs, so such documents fall back to the stdlib parser.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
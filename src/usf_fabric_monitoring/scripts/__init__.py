@@ -7,13 +7,7 @@ Each script provides a standalone CLI tool that can be invoked via:
 - Entry points: usf-<command> (after pip install)
 """
 
-from . import (
-    build_star_schema,
-    enforce_workspace_access,
-    extract_lineage,
-    monitor_hub_pipeline,
-    validate_config,
-)
+import importlib
 
 __all__ = [
     "monitor_hub_pipeline",
@@ -22,3 +16,11 @@ __all__ = [
     "build_star_schema",
     "extract_lineage",
 ]
+
+
+def __getattr__(name):
+    # Scripts are imported on first access so running one entry point does
+    # not pay for importing every other script's dependencies.
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,95 @@
+"""
+Tests for reading daily activity CSV exports (core.data_loader).
+"""
+
+from datetime import datetime
+
+import pandas as pd
+
+from usf_fabric_monitoring.core.csv_exporter import CSVExporter
+from usf_fabric_monitoring.core.data_loader import load_activities_chunked, load_activities_from_directory
+
+
+def write_daily_export(export_dir, day, rows):
+    daily_dir = export_dir / "daily"
+    daily_dir.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(rows).to_csv(daily_dir / f"fabric_activities_{day}.csv", index=False)
+
+
+def create_row(event_id, activity_id=None, duration="12.5", **overrides):
+    row = {
+        "Id": event_id,
+        "ActivityId": activity_id,
+        "Activity": "RunArtifact",
+        "ItemId": f"item-{event_id}",
+        "WorkspaceId": "ws-1",
+        "Status": "Succeeded",
+        "DurationSeconds": duration,
+        "CreationTime": "2026-01-01T10:00:00Z",
+    }
+    row.update(overrides)
+    return row
+
+
+def test_missing_daily_directory_returns_empty(tmp_path):
+    assert load_activities_from_directory(str(tmp_path)) == []
+    assert list(load_activities_chunked(str(tmp_path))) == []
+
+
+def test_normalizes_columns_and_derived_fields(tmp_path):
+    write_daily_export(tmp_path, "20260101", [create_row("e1"), create_row("e2", activity_id="a2", duration="bad")])
+
+    activities = load_activities_from_directory(str(tmp_path))
+
+    assert [a["event_id"] for a in activities] == ["e1", "e2"]
+    assert activities[0]["activity_id"] == "e1"  # backfilled from event_id
+    assert activities[1]["activity_id"] == "a2"
+    assert activities[0]["duration_seconds"] == 12.5
+    assert activities[1]["duration_seconds"] == 0
+    assert activities[0]["start_time"] == "2026-01-01T10:00:00Z"  # falls back to creation_time
+    assert activities[0]["end_time"] is None
+
+
+def test_chunked_batches_match_full_load(tmp_path):
+    write_daily_export(tmp_path, "20260101", [create_row(f"a{i}") for i in range(5)])
+    write_daily_export(tmp_path, "20260102", [create_row(f"b{i}") for i in range(3)])
+
+    batches = list(load_activities_chunked(str(tmp_path), chunk_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1, 2, 1]
+    flattened = [activity for batch in batches for activity in batch]
+    assert flattened == load_activities_from_directory(str(tmp_path))
+
+
+def test_parquet_copy_preferred_and_matches_csv(tmp_path):
+    # Numeric-looking IDs (with a leading zero) must stay strings on both paths
+    rows = [
+        create_row(str(i), DurationSeconds=i * 1.5, WorkspaceName="Sales", UserKey=f"00{i}2") for i in range(1, 5)
+    ]
+    CSVExporter(export_base_path=str(tmp_path)).export_daily_activities(rows, datetime(2026, 1, 1))
+
+    daily_dir = tmp_path / "daily"
+    assert (daily_dir / "fabric_activities_20260101.parquet").exists()
+    from_parquet = load_activities_from_directory(str(tmp_path))
+
+    (daily_dir / "fabric_activities_20260101.parquet").unlink()
+    from_csv = load_activities_from_directory(str(tmp_path))
+
+    assert len(from_parquet) == 4
+    assert from_parquet == from_csv
+    assert [a["event_id"] for a in from_csv] == ["1", "2", "3", "4"]
+    assert from_csv[0]["activity_id"] == "1"
+    assert from_csv[0]["UserKey"] == "0012"
+
+
+def test_numeric_parquet_ids_loaded_as_strings(tmp_path):
+    daily_dir = tmp_path / "daily"
+    daily_dir.mkdir()
+    pd.DataFrame([create_row(7), create_row(8, activity_id=80)]).to_parquet(
+        daily_dir / "fabric_activities_20260101.parquet", index=False
+    )
+
+    activities = load_activities_from_directory(str(tmp_path))
+
+    assert [a["event_id"] for a in activities] == ["7", "8"]
+    assert [a["activity_id"] for a in activities] == ["7", "80"]
@@ -0,0 +1,130 @@
+"""
+Tests for MonitorHubPipeline._build_historical_dataset and _missing_extraction_days
+
+The dataset carries the Fabric activities plus one workspace and one item
+record per distinct id, named from the first activity that mentions it.
+Only days without a daily export are sent to the historical extractor.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+def create_activity(**overrides):
+    """Helper to create a Fabric activity with workspace and item fields."""
+    activity = {
+        "item_type": "Notebook",
+        "workspace_id": "ws-1",
+        "workspace_name": "Sales",
+        "item_id": "item-1",
+        "item_name": "Load Orders",
+    }
+    activity.update(overrides)
+    return activity
+
+
+class TestBuildHistoricalDataset:
+    """Tests for the workspace/item lookups built by _build_historical_dataset."""
+
+    @pytest.fixture
+    def pipeline(self, tmp_path):
+        with patch("usf_fabric_monitoring.core.pipeline.setup_logging"):
+            with patch("usf_fabric_monitoring.core.pipeline.resolve_path", return_value=Path(tmp_path)):
+                from usf_fabric_monitoring.core.pipeline import MonitorHubPipeline
+
+                p = MonitorHubPipeline()
+                p.logger = MagicMock()
+                return p
+
+    def build(self, pipeline, activities):
+        return pipeline._build_historical_dataset(activities, datetime(2026, 1, 1), datetime(2026, 1, 8), 7)
+
+    def test_lookups_keep_first_occurrence_per_id(self, pipeline):
+        activities = [
+            create_activity(),
+            create_activity(workspace_name="Renamed", item_name="Renamed"),
+            create_activity(
+                workspace_id="ws-2",
+                workspace_name="",
+                item_id="item-2",
+                item_name=None,
+                item_type="",
+                source="JobHistory",
+            ),
+        ]
+
+        dataset = self.build(pipeline, activities)
+
+        assert dataset["workspaces"] == [
+            {"id": "ws-1", "displayName": "Sales"},
+            {"id": "ws-2", "displayName": "Unknown"},
+        ]
+        assert dataset["items"] == [
+            {"id": "item-1", "displayName": "Load Orders", "type": "Notebook"},
+            {"id": "item-2", "displayName": "Unknown", "type": "Unknown"},
+        ]
+
+    def test_missing_ids_are_skipped(self, pipeline):
+        activities = [
+            create_activity(workspace_id=None, item_id=""),
+            create_activity(workspace_id="", item_id=None),
+        ]
+
+        dataset = self.build(pipeline, activities)
+
+        assert dataset["workspaces"] == []
+        assert dataset["items"] == []
+        assert len(dataset["activities"]) == 2
+
+    def test_frame_and_failed_mask_align_with_activities(self, pipeline):
+        activities = [create_activity(status="Failed"), create_activity(status="Succeeded"), create_activity()]
+
+        dataset = self.build(pipeline, activities)
+
+        assert dataset["_frame"]["item_id"].tolist() == [a["item_id"] for a in dataset["activities"]]
+        assert dataset["_failed_mask"].tolist() == [True, False, False]
+
+    def test_no_fabric_activities(self, pipeline):
+        dataset = self.build(pipeline, [create_activity(item_type="Unrelated", source="Other")])
+
+        assert dataset["workspaces"] == []
+        assert dataset["items"] == []
+        assert dataset["activities"] == []
+
+
+class TestMissingExtractionDays:
+    """Tests for the incremental-extraction check in _missing_extraction_days."""
+
+    @pytest.fixture
+    def pipeline(self, tmp_path):
+        with patch("usf_fabric_monitoring.core.pipeline.setup_logging"):
+            with patch("usf_fabric_monitoring.core.pipeline.resolve_path", return_value=Path(tmp_path)):
+                from usf_fabric_monitoring.core.pipeline import MonitorHubPipeline
+
+                p = MonitorHubPipeline()
+                p.logger = MagicMock()
+                return p
+
+    def test_only_days_without_exports_are_missing(self, pipeline, tmp_path):
+        daily_dir = tmp_path / "raw_data" / "daily"
+        daily_dir.mkdir(parents=True)
+        (daily_dir / "fabric_activities_20260101.csv").write_text("Id\n1\n")
+        (daily_dir / "fabric_activities_20260103.parquet").write_bytes(b"")
+
+        missing = pipeline._missing_extraction_days(tmp_path / "raw_data", datetime(2026, 1, 1), datetime(2026, 1, 4))
+
+        assert missing == [datetime(2026, 1, 2), datetime(2026, 1, 4)]
+
+    def test_fully_cached_range_skips_extraction(self, pipeline):
+        with patch.object(pipeline, "_missing_extraction_days", return_value=[]):
+            with patch("usf_fabric_monitoring.core.pipeline._get_historical_extraction") as get_extraction:
+                with patch.object(pipeline, "_check_recent_job_details_extraction", return_value=True):
+                    with patch("usf_fabric_monitoring.core.pipeline.load_activities_from_directory", return_value=[]):
+                        with patch.object(pipeline, "_load_detailed_jobs", return_value=[]):
+                            result = pipeline.run_complete_analysis(days=7)
+
+        get_extraction.assert_not_called()
+        assert result["status"] == "no_data"
@@ -0,0 +1,127 @@
+"""
+Tests for the Neo4j lineage analyzer (lineage_explorer/reports/lineage_analyzer.py).
+
+Unit tests run the analyzer against a stub client that records the Cypher it
+is given; the integration test needs a running Neo4j (NEO4J_PASSWORD set).
+"""
+
+import os
+import uuid
+from unittest.mock import patch
+
+import pytest
+from lineage_explorer.reports.lineage_analyzer import LineageAnalyzer
+
+
+class RecordingClient:
+    """Neo4jClient stand-in: records each query and returns canned rows."""
+
+    def __init__(self, rows=None):
+        self.rows = rows if rows is not None else []
+        self.queries = []
+
+    def run_query(self, query, params=None):
+        self.queries.append((query, params))
+        return self.rows
+
+
+class TestGetTablesBySchema:
+    def test_unnamed_consumers_and_providers_are_not_collected(self):
+        client = RecordingClient()
+        LineageAnalyzer(client).get_tables_by_schema("DRH")
+
+        query = " ".join(client.queries[0][0].split())
+        assert "collect(DISTINCT CASE WHEN consumer.name <> '' THEN consumer {.name, .type, .id} END)" in query
+        assert "collect(DISTINCT CASE WHEN provider.name <> '' THEN provider {.name, .type, .id} END)" in query
+
+    def test_rows_grouped_by_schema(self):
+        client = RecordingClient([
+            {"schema": "A", "table_name": "t1"},
+            {"schema": "A", "table_name": "t2"},
+            {"schema": "B", "table_name": "t3"},
+        ])
+        grouped = LineageAnalyzer(client).get_tables_by_schema()
+
+        assert {schema: [row["table_name"] for row in rows] for schema, rows in grouped.items()} == {
+            "A": ["t1", "t2"],
+            "B": ["t3"],
+        }
+
+
+class TestResultCache:
+    def test_cache_bounded_by_maxsize(self):
+        client = RecordingClient()
+        analyzer = LineageAnalyzer(client, cache_maxsize=3)
+        for limit in range(10):
+            analyzer.get_items_by_type("Lakehouse", limit=limit)
+
+        assert len(analyzer._cache) == 3
+        analyzer.get_items_by_type("Lakehouse", limit=9)
+        assert len(client.queries) == 10  # Most recent limit still cached
+        analyzer.get_items_by_type("Lakehouse", limit=0)
+        assert len(client.queries) == 11  # Oldest limit was evicted
+
+    def test_recently_used_entry_survives_eviction(self):
+        client = RecordingClient()
+        analyzer = LineageAnalyzer(client, cache_maxsize=2)
+        analyzer.get_cross_workspace_dependencies(limit=1)
+        analyzer.get_cross_workspace_dependencies(limit=2)
+        analyzer.get_cross_workspace_dependencies(limit=1)
+        analyzer.get_cross_workspace_dependencies(limit=3)
+
+        analyzer.get_cross_workspace_dependencies(limit=1)
+        assert len(client.queries) == 3
+
+    def test_item_lookups_bounded_by_maxsize(self):
+        analyzer = LineageAnalyzer(RecordingClient(), cache_maxsize=5)
+        for i in range(50):
+            analyzer.find_path_between_items(f"source_{i}", "target")
+
+        assert len(analyzer._cache) == 5
+
+    def test_equivalent_calls_share_one_entry(self):
+        client = RecordingClient()
+        analyzer = LineageAnalyzer(client)
+        analyzer.get_items_by_type("Lakehouse")
+        analyzer.get_items_by_type("Lakehouse", None)
+        analyzer.get_items_by_type(item_type="Lakehouse", limit=None)
+
+        assert len(client.queries) == 1
+        assert len(analyzer._cache) == 1
+
+    def test_expired_entries_dropped_on_insert(self):
+        analyzer = LineageAnalyzer(RecordingClient(), cache_ttl_seconds=60)
+        with patch("time.monotonic", return_value=1000.0):
+            analyzer.get_items_by_type("Lakehouse", limit=1)
+            analyzer.get_items_by_type("Lakehouse", limit=2)
+        with patch("time.monotonic", return_value=1100.0):
+            analyzer.get_items_by_type("Lakehouse", limit=3)
+
+        assert len(analyzer._cache) == 1
+
+
+@pytest.mark.integration
+def test_null_named_consumer_not_counted():
+    if not os.getenv("NEO4J_PASSWORD"):
+        pytest.skip("NEO4J_PASSWORD not set; skipping Neo4j integration test.")
+    from lineage_explorer.graph_database.neo4j_client import Neo4jClient
+
+    schema = f"TEST_{uuid.uuid4().hex[:8]}"
+    client = Neo4jClient().connect()
+    try:
+        client.run_write_query("""
+            CREATE (t:Table {name: 'orders', schema: $schema})
+            CREATE (:FabricItem {id: $schema + '-named', name: 'Report', type: 'Report'})-[:USES_TABLE]->(t)
+            CREATE (:FabricItem {id: $schema + '-unnamed', type: 'Notebook'})-[:USES_TABLE]->(t)
+        """, {"schema": schema})
+
+        rows = LineageAnalyzer(client).get_tables_by_schema(schema)[schema]
+
+        assert rows[0]["consumer_count"] == 1
+        assert [consumer["name"] for consumer in rows[0]["consumers"]] == ["Report"]
+    finally:
+        client.run_write_query("""
+            MATCH (n) WHERE n.schema = $schema OR n.id STARTS WITH $schema
+            DETACH DELETE n
+        """, {"schema": schema})
+        client.close()
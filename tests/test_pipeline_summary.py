@@ -0,0 +1,104 @@
+"""
+Tests for MonitorHubPipeline._create_pipeline_summary
+
+The summary reports the key measurables (activities, failures, success rate,
+duration) and the analysis scope (unique workspaces/users/domains/item types).
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+
+def create_activity(status="Succeeded", duration_seconds=10.0, **overrides):
+    """Helper to create an activity record with the fields the summary reads."""
+    activity = {
+        "status": status,
+        "duration_seconds": duration_seconds,
+        "workspace_id": "ws-1",
+        "submitted_by": "user@example.com",
+        "domain": "Finance",
+        "item_type": "Notebook",
+    }
+    activity.update(overrides)
+    return activity
+
+
+class TestPipelineSummary:
+    """Tests for the _create_pipeline_summary method in MonitorHubPipeline."""
+
+    @pytest.fixture
+    def pipeline(self, tmp_path):
+        """Create a pipeline instance writing into a temporary directory."""
+        with patch("usf_fabric_monitoring.core.pipeline.setup_logging"):
+            with patch("usf_fabric_monitoring.core.pipeline.resolve_path", return_value=Path(tmp_path)):
+                from usf_fabric_monitoring.core.pipeline import MonitorHubPipeline
+
+                p = MonitorHubPipeline()
+                p.logger = MagicMock()
+                return p
+
+    @pytest.fixture
+    def activities(self):
+        return [
+            create_activity(),
+            create_activity(status="Failed", duration_seconds=30.0, workspace_id="ws-2"),
+            create_activity(duration_seconds=None, submitted_by="", domain=None),
+            create_activity(status="Failed", duration_seconds=3560.0, item_type="Report"),
+        ]
+
+    def test_summary_key_measurables(self, pipeline, activities):
+        summary = pipeline._create_pipeline_summary({"activities": activities}, {}, 7)
+
+        measurables = summary["key_measurables"]
+        assert measurables["total_activities"] == 4
+        assert measurables["failed_activities"] == 2
+        assert measurables["success_rate_percent"] == 50.0
+        assert measurables["total_duration_hours"] == 1.0
+
+    def test_summary_scope_ignores_missing_values(self, pipeline, activities):
+        summary = pipeline._create_pipeline_summary({"activities": activities}, {}, 7)
+
+        assert summary["analysis_scope"] == {
+            "unique_workspaces": 2,
+            "unique_users": 1,
+            "unique_domains": 1,
+            "unique_item_types": 2,
+        }
+
+    def test_summary_from_frame_matches_list(self, pipeline, activities):
+        from_list = pipeline._create_pipeline_summary({"activities": activities}, {}, 7)
+        from_frame = pipeline._create_pipeline_summary({"activities": activities}, {}, 7, pd.DataFrame(activities))
+
+        assert from_frame["key_measurables"] == from_list["key_measurables"]
+        assert from_frame["analysis_scope"] == from_list["analysis_scope"]
+
+    def test_summary_no_activities(self, pipeline):
+        summary = pipeline._create_pipeline_summary({"activities": []}, {}, 7)
+
+        assert summary["key_measurables"]["total_activities"] == 0
+        assert summary["key_measurables"]["success_rate_percent"] == 0
+        assert summary["analysis_scope"]["unique_workspaces"] == 0
+
+    def test_summary_written_to_output_directory(self, pipeline, activities):
+        pipeline._create_pipeline_summary({"activities": activities}, {}, 7, pd.DataFrame(activities))
+
+        summary_files = list(pipeline.output_directory.glob("pipeline_summary_*.json"))
+        assert summary_files
+        written = json.loads(summary_files[0].read_text(encoding="utf-8"))
+        assert written["key_measurables"]["total_activities"] == 4
+        assert written["key_measurables"]["failed_activities"] == 2
+
+    def test_summary_row_written_to_parquet(self, pipeline, activities):
+        pipeline._create_pipeline_summary({"activities": activities}, {"csv": "report.csv"}, 7)
+
+        parquet_files = list(pipeline.output_directory.glob("pipeline_summary_*.parquet"))
+        assert len(parquet_files) == 1
+        row = pd.read_parquet(parquet_files[0]).iloc[0]
+        assert row["analysis_period_days"] == 7
+        assert row["total_reports_generated"] == 1
+        assert row["failed_activities"] == 2
+        assert row["unique_item_types"] == 2
@@ -259,3 +259,40 @@ class TestStatusDimensionBuilder:
         status_codes = dim_df["status_code"].tolist()
         assert "Succeeded" in status_codes
         assert "Failed" in status_codes
+
+
+class TestFactActivityBuilder:
+    """Tests for FactActivityBuilder timestamp handling."""
+
+    @pytest.fixture
+    def builder(self):
+        import pandas as pd
+
+        from usf_fabric_monitoring.core.star_schema_builder import FactActivityBuilder
+
+        empty = pd.DataFrame()
+        return FactActivityBuilder(empty, empty, empty, empty, empty)
+
+    def test_date_and_time_keys_fall_back_to_end_time(self, builder):
+        activities = [
+            {"event_id": "e1", "start_time": "2026-01-01T10:07:00Z", "status": "Succeeded"},
+            {"event_id": "e2", "start_time": "not a date", "end_time": "2026-01-02T23:59:59Z", "status": "Failed"},
+            {"event_id": "e3", "start_time": None, "end_time": None},
+        ]
+
+        fact_df = builder.build_from_activities(activities)
+
+        assert fact_df["date_sk"].tolist()[:2] == [20260101, 20260102]
+        assert fact_df["time_sk"].tolist()[:2] == [1000, 2345]
+        assert fact_df["date_sk"].isna().tolist() == [False, False, True]
+
+    def test_high_water_mark_skips_older_activities(self, builder):
+        activities = [
+            {"event_id": "old", "start_time": "2025-12-01T00:00:00Z"},
+            {"event_id": "new", "start_time": "2026-01-01T00:00:00+02:00"},
+            {"event_id": "no_start", "end_time": "2025-11-01T00:00:00Z"},
+        ]
+
+        fact_df = builder.build_from_activities(activities, high_water_mark=datetime(2025, 12, 15))
+
+        assert fact_df["event_id"].tolist() == ["new", "no_start"]